@@ -112,6 +112,12 @@ from openeogeotrellis.ml.geopysparkcatboostmodel import GeopySparkCatBoostModel
 from openeogeotrellis.ml.geopysparkmlmodel import GeopysparkMlModel
 from openeogeotrellis.ml.geopysparkrandomforestmodel import GeopySparkRandomForestModel
 from openeogeotrellis.processgraphvisiting import GeotrellisTileProcessGraphVisitor, SingleNodeUDFProcessGraphVisitor
+from openeogeotrellis.results_metadata import (
+    JOB_METADATA_FILENAME,
+    get_job_output_dir,
+    get_results_metadata_path,
+    load_results_metadata,
+)
 from openeogeotrellis.sentinel_hub.batchprocessing import SentinelHubBatchProcessing
 from openeogeotrellis.service_registry import (
     AbstractServiceRegistry,
@@ -129,7 +135,6 @@ from openeogeotrellis.utils import (
     add_permissions,
     dict_merge_recursive,
     get_jvm,
-    get_s3_file_contents,
     mdc_include,
     mdc_remove,
     normalize_temporal_extent,
@@ -141,10 +146,23 @@ from openeogeotrellis.utils import (
 )
 from openeogeotrellis.vault import Vault
 
-JOB_METADATA_FILENAME = "job_metadata.json"
-
 logger = logging.getLogger(__name__)
 
+_SENTINEL1_MISSING_BAND_REGEX = re.compile(r"Requested band '([^']+)' is not present in Sentinel 1 tile ")
+
+# Well-known hints used in error summaries.
+_SENTINEL1_MISSING_BAND_HINT_TEMPLATE = (
+    "Requested band '{band}' is not present in Sentinel 1 tile;"
+    ' try specifying a "polarization" property filter according to the table at'
+    " https://docs.sentinel-hub.com/api/latest/data/sentinel-1-grd/#polarization."
+)
+_PYTHON_MEMORY_HINT = "Ran out of memory. If you run as a batch_job, consider increasing job_options > python-memory."
+_REPEATED_TASK_FAILURE_HINT = (
+    "A part of your process graph failed multiple times. Simply try submitting again,"
+    " or use batch job logs to find more detailed information in case of persistent failures."
+    " Increasing executor memory may help if the root cause is not clear from the logs."
+)
+
 
 class GpsSecondaryServices(backend.SecondaryServices):
     """Secondary Services implementation for GeoPySpark backend"""
@@ -643,9 +661,13 @@ class GeoPySparkBackendImplementation(backend.OpenEoBackendImplementation):
 
         temporal_tiled_raster_layer = jvm.geopyspark.geotrellis.TemporalTiledRasterLayer
         option = jvm.scala.Option
-        levels = {pyramid.apply(index)._1(): TiledRasterLayer(LayerType.SPACETIME, temporal_tiled_raster_layer(
-            option.apply(pyramid.apply(index)._1()), pyramid.apply(index)._2())) for index in
-                  range(0, pyramid.size())}
+        levels = {}
+        for index in range(0, pyramid.size()):
+            zoom_and_layer = pyramid.apply(index)
+            zoom = zoom_and_layer._1()
+            levels[zoom] = TiledRasterLayer(
+                LayerType.SPACETIME, temporal_tiled_raster_layer(option.apply(zoom), zoom_and_layer._2())
+            )
 
         image_collection = GeopysparkDataCube(
             pyramid=gps.Pyramid(levels),
@@ -797,10 +819,14 @@ class GeoPySparkBackendImplementation(backend.OpenEoBackendImplementation):
         temporal_tiled_raster_layer = jvm.geopyspark.geotrellis.TemporalTiledRasterLayer
         option = jvm.scala.Option
 
-        # noinspection PyProtectedMember
-        levels = {pyramid.apply(index)._1(): TiledRasterLayer(LayerType.SPACETIME, temporal_tiled_raster_layer(
-            option.apply(pyramid.apply(index)._1()), pyramid.apply(index)._2())) for index in
-                  range(0, pyramid.size())}
+        levels = {}
+        for index in range(0, pyramid.size()):
+            # noinspection PyProtectedMember
+            zoom_and_layer = pyramid.apply(index)
+            zoom = zoom_and_layer._1()
+            levels[zoom] = TiledRasterLayer(
+                LayerType.SPACETIME, temporal_tiled_raster_layer(option.apply(zoom), zoom_and_layer._2())
+            )
 
         cube = GeopysparkDataCube(pyramid=gps.Pyramid(levels), metadata=metadata)
 
@@ -1070,27 +1096,27 @@ class GeoPySparkBackendImplementation(backend.OpenEoBackendImplementation):
                 return [from_java_exception] + get_exception_chain(from_java_exception.getCause())
 
             exception_chain = get_exception_chain(error.java_exception)
+            # Resolve class names once: each `getClass().getName()` is a round-trip to the JVM.
+            exception_class_names = [exception.getClass().getName() for exception in exception_chain]
             root_cause = exception_chain[-1]
-            root_cause_class_name = root_cause.getClass().getName()
+            root_cause_class_name = exception_class_names[-1]
             root_cause_message = root_cause.getMessage()
 
             # Snippet to get JVM stack trace:
             # get_jvm().org.apache.commons.lang.exception.ExceptionUtils.getStackTrace(root_cause)
 
-            logger.debug(f"exception chain classes: "
-                         f"{' caused by '.join(exception.getClass().getName() for exception in exception_chain)}")
+            logger.debug(f"exception chain classes: {' caused by '.join(exception_class_names)}")
 
             no_data_found = (root_cause_class_name == 'java.lang.AssertionError'
                              and "Cannot stitch empty collection" in root_cause_message)
-            is_spark_exception = "SparkException" in error.java_exception.getClass().getName()
+            is_spark_exception = "SparkException" in exception_class_names[0]
 
             def get_missing_sentinel1_band() -> Optional[str]:
                 if root_cause_class_name == 'org.openeo.geotrellissentinelhub.Sentinel1BandNotPresentException':
                     return root_cause.missingBandName()
 
                 if is_spark_exception:
-                    band_name_regex = re.compile(r".*Requested band '(.+)' is not present in Sentinel 1 tile .+")
-                    match = band_name_regex.search(error.java_exception.getMessage())
+                    match = _SENTINEL1_MISSING_BAND_REGEX.search(error.java_exception.getMessage())
                     if match:
                         missing_band_name = match.group(1)
                         return missing_band_name
@@ -1099,7 +1125,9 @@ class GeoPySparkBackendImplementation(backend.OpenEoBackendImplementation):
 
             missing_sentinel1_band = get_missing_sentinel1_band()
 
-            kubernetes_exception = [e for e in exception_chain if "KubernetesClientException" in e.getClass().getName()]
+            kubernetes_exception = [
+                e for e, name in zip(exception_chain, exception_class_names) if "KubernetesClientException" in name
+            ]
 
             is_client_error = (root_cause_class_name == 'java.lang.IllegalArgumentException' or no_data_found or
                                missing_sentinel1_band)
@@ -1110,9 +1138,7 @@ class GeoPySparkBackendImplementation(backend.OpenEoBackendImplementation):
                 summary = "Your batch job failed because the 'driver' used too much java memory. Consider increasing driver-memory or contact the developers to investigate."
             elif is_spark_exception:
                 if missing_sentinel1_band:
-                    summary = (f"Requested band '{missing_sentinel1_band}' is not present in Sentinel 1 tile;"
-                               f' try specifying a "polarization" property filter according to the table at'
-                               f' https://docs.sentinel-hub.com/api/latest/data/sentinel-1-grd/#polarization.')
+                    summary = _SENTINEL1_MISSING_BAND_HINT_TEMPLATE.format(band=missing_sentinel1_band)
                 elif len(kubernetes_exception) > 0:
                     if error.java_exception.getMessage().contains("External scheduler cannot be instantiated") :
                         summary = (f"Batch job failed to initialize, try running again, or contact support if the problem persists. Detailed cause: {kubernetes_exception[0].getMessage()} - {root_cause_message}")
@@ -1121,13 +1147,10 @@ class GeoPySparkBackendImplementation(backend.OpenEoBackendImplementation):
                 elif root_cause_message:
                     root_cause_message = root_cause_message.rstrip()
                     so_error = "failed to map segment from shared object"
-                    memory_message = (
-                        "Ran out of memory. If you run as a batch_job, consider increasing job_options > python-memory."
-                    )
                     if so_error in root_cause_message and not so_error + ":" in root_cause_message:
                         # This error can be so obscure that we replace it with our own message:
                         # After the ":" there might be "operation not permitted", in that case we don't change the message
-                        return ErrorSummary(error, True, memory_message)
+                        return ErrorSummary(error, True, _PYTHON_MEMORY_HINT)
 
                     # if root_cause_class_name == 'jep.JepException':
                     #     st = root_cause.stackTrace  # NOTE: UDF stack trace in Jep is not supported yet.
@@ -1139,7 +1162,7 @@ class GeoPySparkBackendImplementation(backend.OpenEoBackendImplementation):
 
                         summary = f"UDF exception while evaluating processing graph. Please check your user defined functions. stacktrace:\n{udf_stacktrace}"
                         if udf_stacktrace.endswith("MemoryError") or udf_stacktrace.endswith("std::bad_alloc"):
-                            summary += "\n" + memory_message
+                            summary += "\n" + _PYTHON_MEMORY_HINT
                         return ErrorSummary(error, is_client_error, summary)
 
                     # Could be an error in the OpenEO stack
@@ -1148,7 +1171,7 @@ class GeoPySparkBackendImplementation(backend.OpenEoBackendImplementation):
                         summary = f"Python exception while evaluating processing graph: {python_error}"
                         if python_error.endswith("MemoryError") or python_error.endswith("MemoryError: std::bad_alloc"):
                             # Got OOM before getting in user UDF code:
-                            summary += "\n" + memory_message
+                            summary += "\n" + _PYTHON_MEMORY_HINT
                     elif (
                         "Missing an output location" in root_cause_message
                         or (  # OOM on YARN
@@ -1157,7 +1180,7 @@ class GeoPySparkBackendImplementation(backend.OpenEoBackendImplementation):
                         )
                         or "has failed the maximum allowable number of times" in root_cause_message
                     ):
-                        summary = f"A part of your process graph failed multiple times. Simply try submitting again, or use batch job logs to find more detailed information in case of persistent failures. Increasing executor memory may help if the root cause is not clear from the logs."
+                        summary = _REPEATED_TASK_FAILURE_HINT
                     else:
                         summary = f"Exception during Spark execution: {root_cause_class_name}: {root_cause_message}"
                 else:
@@ -1228,9 +1251,10 @@ class GeoPySparkBackendImplementation(backend.OpenEoBackendImplementation):
         if len(lines) < 2 or not lines[0].strip().startswith("Traceback (most recent call last)"):
             return None
         # find line that shows error:
-        index = next((i for i, line in enumerate(lines) if not line.startswith(" ") and i >= 1), 0)
+        index = next((i for i in range(1, len(lines)) if not lines[i].startswith(" ")), 0)
         another_exception = "During handling of the above exception, another exception occurred"
-        index2 = next((i for i, line in enumerate(lines) if another_exception in line and i > index), len(lines))
+        # continue scanning from there instead of starting over from the top
+        index2 = next((i for i in range(index + 1, len(lines)) if another_exception in lines[i]), len(lines))
         return "\n".join(lines[index:index2]).strip()
 
     def changelog(self) -> Union[str, Path, flask.Response]:
@@ -1762,11 +1786,7 @@ class GpsBatchJobs(backend.BatchJobs):
 
     # TODO: issue #232 we should get this from S3 but should there still be an output dir then?
     def get_job_output_dir(self, job_id: str) -> Path:
-        # TODO: instead of flat dir with potentially a lot of subdirs (which is hard to maintain/clean up):
-        #       add an intermediate level (e.g. based on job_id/user_id prefix or date or ...)?
-        # TODO: this so called "output" dir is also being used for "input" (e.g. specification file, UDF deps, ...),
-        #       so "work dir" would be a better name. Also see `get_job_work_dir`.
-        return self._output_root_dir / job_id
+        return get_job_output_dir(output_root_dir=self._output_root_dir, job_id=job_id)
 
     def get_job_work_dir(self, job_id: str) -> Path:
         """
@@ -2918,32 +2938,13 @@ class GpsBatchJobs(backend.BatchJobs):
         return results_dict
 
     def get_results_metadata_path(self, job_id: str) -> Path:
-        return self.get_job_output_dir(job_id) / JOB_METADATA_FILENAME
+        return get_results_metadata_path(output_root_dir=self._output_root_dir, job_id=job_id)
 
     def load_results_metadata(self, job_id: str, user_id: str) -> dict:
         """
         Reads the metadata json file from the job directory and returns it.
         """
-        metadata_file = self.get_results_metadata_path(job_id=job_id)
-
-        if ConfigParams().use_object_storage:
-            try:
-                contents = get_s3_file_contents(str(metadata_file))
-                return json.loads(contents)
-            except Exception:
-                logger.warning(
-                    "Could not retrieve result metadata from object storage %s",
-                    metadata_file, exc_info=True,
-                    extra={'job_id': job_id})
-
-        try:
-            with open(metadata_file) as f:
-                return json.load(f)
-        except FileNotFoundError:
-            logger.warning("Could not derive result metadata from %s", metadata_file, exc_info=True,
-                           extra={'job_id': job_id})
-
-        return {}
+        return load_results_metadata(output_root_dir=self._output_root_dir, job_id=job_id)
 
     def _get_providers(self, job_id: str, user_id: str) -> List[dict]:
         results_metadata = self.load_results_metadata(job_id, user_id)
@@ -34,7 +34,7 @@ from openeo_driver.utils import smart_bool
 from openeogeotrellis.collections import convert_scala_metadata
 from openeogeotrellis.config import get_backend_config
 from openeogeotrellis.util.runtime import in_batch_job_context
-from openeogeotrellis.utils import lonlat_to_mercator_tile_indices, nullcontext, get_jvm, set_max_memory, \
+from openeogeotrellis.utils import lonlat_to_mercator_tile_indices_batch, nullcontext, get_jvm, set_max_memory, \
     ensure_executor_logging
 
 logger = logging.getLogger(__name__)
@@ -644,8 +644,9 @@ class S1BackscatterOrfeo:
             pyproj.Transformer.from_crs(crs_from=bbox_epsg, crs_to=4326, always_xy=True).transform,
             shapely.geometry.box(*bbox)
         )
+        # Transform all vertices in one call (shapely passes coordinate sequences)
         bbox_indices = shapely.ops.transform(
-            lambda x, y: lonlat_to_mercator_tile_indices(x, y, zoom=zoom, tile_size=dem_tile_size, flip_y=True),
+            lambda x, y: lonlat_to_mercator_tile_indices_batch(x, y, zoom=zoom, tile_size=dem_tile_size, flip_y=True),
             bbox_lonlat
         )
         xmin, ymin, xmax, ymax = [int(b) for b in bbox_indices.bounds]
@@ -61,7 +61,7 @@ class EtlApiConfig(metaclass=abc.ABCMeta):
         return None
 
 
-@attrs.frozen(kw_only=True)
+@attrs.frozen(kw_only=True, slots=True)
 class GpsBackendConfig(OpenEoBackendConfig):
     """
     Configuration for GeoPySpark backend.
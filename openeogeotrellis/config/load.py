@@ -11,6 +11,9 @@ class GpsConfigGetter(ConfigGetter):
     expected_class = GpsBackendConfig
 
     def __call__(self, force_reload: bool = False, *, show_stack: bool = True) -> GpsBackendConfig:
+        # Fast path for the (very common) case of an already loaded config
+        if self._config is not None and not force_reload:
+            return self._config
         return self.get(force_reload=force_reload, show_stack=show_stack)
 
     def _default_config(self) -> ContextManager[Path]:
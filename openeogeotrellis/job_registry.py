@@ -1017,6 +1017,9 @@ class DoubleJobRegistry:  # TODO: extend JobRegistryInterface?
                     "application_id",
                     "status",
                     "created",
+                    "updated",
+                    "started",
+                    "finished",
                     "title",
                     "job_options",
                     "dependencies",
@@ -8,12 +8,11 @@ import argparse
 import collections
 import datetime as dt
 import logging
-from decimal import Decimal
 from math import isfinite
 from pathlib import Path
 from typing import Any, List, NamedTuple, Optional, Union
 
-import requests
+import dateutil.parser
 
 from openeogeotrellis.config import get_backend_config
 from openeogeotrellis.integrations.prometheus import Prometheus
@@ -37,7 +36,7 @@ from openeo_driver.util.logging import (
 import openeo_driver.utils
 
 from openeogeotrellis import async_task
-from openeogeotrellis.backend import GpsBatchJobs, get_elastic_job_registry
+from openeogeotrellis.backend import get_elastic_job_registry
 from openeogeotrellis.configparams import ConfigParams
 from openeogeotrellis.integrations.kubernetes import (
     K8S_SPARK_APP_STATE,
@@ -53,11 +52,18 @@ from openeogeotrellis.job_costs_calculator import (
     NoJobCostsCalculator,
 )
 from openeogeotrellis.job_registry import DoubleJobRegistry, ZkJobRegistry, get_deletable_dependency_sources
+from openeogeotrellis.results_metadata import load_results_metadata
 from openeogeotrellis.utils import StatsReporter, dict_merge_recursive, to_jsonable
 
 # Note: hardcoded logger name as this script is executed directly which kills the usefulness of `__name__`.
 _log = logging.getLogger("openeogeotrellis.job_tracker_v2")
 
+_FINAL_JOB_STATUSES = frozenset({JOB_STATUS.FINISHED, JOB_STATUS.ERROR, JOB_STATUS.CANCELED})
+
+# Refresh the "updated" timestamp of unchanged jobs at least this often
+# (e.g. to keep them within the `max_updated_ago` window of active job listing).
+_STATUS_REFRESH_INTERVAL = dt.timedelta(hours=1)
+
 
 class _Usage(NamedTuple):
     cpu_seconds: Optional[float] = None
@@ -134,6 +140,8 @@ class YarnAppReportParseException(Exception):
 class YarnStatusGetter(JobMetadataGetterInterface):
     """YARN app status getter"""
 
+    REQUESTS_TIMEOUT_SECONDS = 20
+
     def __init__(self, yarn_api_base_url: str, auth: Optional[Any] = None):
         """Constructor for a YarnStatusGetter instance.
 
@@ -154,6 +162,12 @@ class YarnStatusGetter(JobMetadataGetterInterface):
         """
         self.yarn_api_base_url = yarn_api_base_url
         self.auth = auth
+        # Reuse connections across the (many) per-app requests of a single tracker run
+        # and retry transient YARN RM failures (note: 404 "app not found" is not retried).
+        # With `raise_on_status=False`, a persistent error status still ends up as `HTTPError` (not `RetryError`).
+        self._session = requests_with_retry(
+            total=3, backoff_factor=0.5, allowed_methods=frozenset(["GET"]), raise_on_status=False
+        )
 
     def get_application_url(self, application_id: str) -> str:
         """Get the URL to get the application status from the YARN REST API.
@@ -169,7 +183,7 @@ class YarnStatusGetter(JobMetadataGetterInterface):
 
     def get_job_metadata(self, job_id: str, user_id: str, app_id: str) -> _JobMetadata:
         url = self.get_application_url(application_id=app_id)
-        response = requests.get(url, auth=self.auth)
+        response = self._session.get(url, auth=self.auth, timeout=self.REQUESTS_TIMEOUT_SECONDS)
         if response.status_code == 404:
             raise AppNotFound(response)
         else:
@@ -316,10 +330,14 @@ class K8sStatusGetter(JobMetadataGetterInterface):
             start_time = finish_time = None
 
         job_status = k8s_state_to_openeo_job_status(app_state)
+        # Usage stats are only consumed once the job reached a final status:
+        # don't bother querying Prometheus for ongoing jobs.
+        if job_status in _FINAL_JOB_STATUSES:
+            usage = self._get_usage(app_id, start_time, finish_time, job_id, user_id)
+        else:
+            usage = _Usage()
         return _JobMetadata(
-            app_state=app_state, status=job_status, usage=self._get_usage(app_id, start_time, finish_time,
-                                                                          job_id, user_id),
-            start_time=start_time, finish_time=finish_time
+            app_state=app_state, status=job_status, usage=usage, start_time=start_time, finish_time=finish_time
         )
 
     def _get_usage(self, application_id: str, start_time: Optional[dt.datetime], finish_time: Optional[dt.datetime],
@@ -389,25 +407,13 @@ class JobTracker:
         self,
         app_state_getter: JobMetadataGetterInterface,
         zk_job_registry: Optional[ZkJobRegistry],
-        principal: str,
-        keytab: str,
         job_costs_calculator: Optional[JobCostsCalculator] = None,
         output_root_dir: Optional[Union[str, Path]] = None,
         elastic_job_registry: Optional[ElasticJobRegistry] = None
     ):
         self._app_state_getter = app_state_getter
         self._job_costs_calculator: JobCostsCalculator = job_costs_calculator or NoJobCostsCalculator()
-        # TODO: inject GpsBatchJobs (instead of constructing it here and requiring all its constructor args to be present)
-        #       Also note that only `load_results_metadata` is actually used, so dragging a complete GpsBatchJobs might actually be overkill in the first place.
-        self._batch_jobs = GpsBatchJobs(
-            catalog=None,
-            jvm=None,
-            principal=principal,
-            key_tab=keytab,
-            vault=None,
-            output_root_dir=output_root_dir,
-            elastic_job_registry=elastic_job_registry,
-        )
+        self._output_root_dir = Path(output_root_dir or ConfigParams().batch_job_output_root)
         self._double_job_registry = DoubleJobRegistry(
             zk_job_registry_factory=(lambda: zk_job_registry) if zk_job_registry else None,
             elastic_job_registry=elastic_job_registry,
@@ -437,6 +443,8 @@ class JobTracker:
                 user_id = job_info["user_id"]
                 application_id = job_info["application_id"]
 
+                # Collect per-job stats locally and merge them into the global stats in one go.
+                job_stats = collections.Counter()
                 try:
                     self._sync_job_status(
                         job_id=job_id,
@@ -444,16 +452,18 @@ class JobTracker:
                         application_id=application_id,
                         job_info=job_info,
                         double_job_registry=double_job_registry,
-                        stats=stats,
+                        stats=job_stats,
                     )
                 except Exception as e:
                     _log.exception(
                         f"Failed status sync for {job_id=}: unexpected {type(e).__name__}: {e}",
                         extra={"job_id": job_id, "user_id": user_id},
                     )
-                    stats["failed sync"] += 1
+                    job_stats["failed sync"] += 1
                     if fail_fast:
                         raise
+                finally:
+                    stats.update(job_stats)
 
     def _sync_job_status(
         self,
@@ -464,7 +474,14 @@ class JobTracker:
         double_job_registry: DoubleJobRegistry,
         stats: collections.Counter,
     ):
-        """Sync job status for a single job"""
+        """
+        Sync job status for a single job.
+
+        Note that the job's status is only written to the job registries (bumping its "updated" timestamp)
+        when status, start time or finish time changed, or when the last update
+        is older than `_STATUS_REFRESH_INTERVAL` (hourly heartbeat),
+        instead of on every sync.
+        """
         # Local logger with default `extra`
         log = logging.LoggerAdapter(_log, extra={"job_id": job_id, "user_id": user_id})
 
@@ -503,13 +520,9 @@ class JobTracker:
             stats["status same"] += 1
             stats[f"status same {job_metadata.status!r}"] += 1
 
-        if job_metadata.status in {
-            JOB_STATUS.FINISHED,
-            JOB_STATUS.ERROR,
-            JOB_STATUS.CANCELED,
-        }:
+        if job_metadata.status in _FINAL_JOB_STATUSES:
             stats[f"reached final status {job_metadata.status}"] += 1
-            result_metadata = self._batch_jobs.load_results_metadata(job_id, user_id)
+            result_metadata = load_results_metadata(self._output_root_dir, job_id=job_id)
 
             double_job_registry.remove_dependencies(job_id, user_id)
 
@@ -531,8 +544,7 @@ class JobTracker:
                     .get("value", 0.0)
                 )
 
-                sentinelhub_batch_processing_units = float(ZkJobRegistry.get_dependency_usage(job_info)
-                                                           or Decimal("0.0"))
+                sentinelhub_batch_processing_units = float(ZkJobRegistry.get_dependency_usage(job_info) or 0.0)
 
                 sentinelhub_processing_units_to_report = (sentinelhub_processing_units +
                                                           sentinelhub_batch_processing_units) or None
@@ -579,15 +591,41 @@ class JobTracker:
             )
 
         datetime_formatter = Rfc3339(propagate_none=True)
+        started = datetime_formatter.datetime(job_metadata.start_time)
+        finished = datetime_formatter.datetime(job_metadata.finish_time)
+
+        if (
+            job_metadata.status == previous_status
+            and started == job_info.get("started")
+            and finished == job_info.get("finished")
+            and not self._status_refresh_due(job_info)
+        ):
+            stats["skip status update (no change)"] += 1
+            return
 
         double_job_registry.set_status(
             job_id=job_id,
             user_id=user_id,
             status=job_metadata.status,
-            started=datetime_formatter.datetime(job_metadata.start_time),
-            finished=datetime_formatter.datetime(job_metadata.finish_time),
+            started=started,
+            finished=finished,
         )
 
+    @staticmethod
+    def _status_refresh_due(job_info: dict) -> bool:
+        """Is it time to refresh the job's "updated" timestamp, even if nothing else changed?"""
+        updated = job_info.get("updated")
+        if not isinstance(updated, str):
+            return True
+        try:
+            updated = dateutil.parser.isoparse(updated)
+        except ValueError:
+            return True
+        if updated.tzinfo is None:
+            # Job registries store timestamps in UTC
+            updated = updated.replace(tzinfo=dt.timezone.utc)
+        return dt.datetime.now(dt.timezone.utc) - updated > _STATUS_REFRESH_INTERVAL
+
 
 class CliApp:
     def main(self, *, args: Optional[List[str]] = None):
@@ -656,8 +694,6 @@ class CliApp:
                 job_tracker = JobTracker(
                     app_state_getter=app_state_getter,
                     zk_job_registry=zk_job_registry,
-                    principal=args.principal,
-                    keytab=args.keytab,
                     elastic_job_registry=elastic_job_registry,
                     job_costs_calculator=job_costs_calculator
                 )
@@ -675,12 +711,12 @@ class CliApp:
             "--principal",
             # TODO: eliminate hardcoded (VITO) defaults? Open-EO/openeo-python-driver#275
             default="openeo@VGT.VITO.BE",
-            help="Principal to be used to login to KDC",
+            help="Principal to be used to login to KDC (deprecated: unused).",
         )
         parser.add_argument(
             "--keytab",
             default="openeo-deploy/mep/openeo.keytab",
-            help="The full path to the file that contains the keytab for the principal",
+            help="The full path to the file that contains the keytab for the principal (deprecated: unused).",
         )
 
         parser.add_argument(
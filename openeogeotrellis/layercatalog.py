@@ -746,13 +746,14 @@ class GeoPySparkLayerCatalog(CollectionCatalog):
             temporal_tiled_raster_layer = jvm.geopyspark.geotrellis.TemporalTiledRasterLayer
             option = jvm.scala.Option
 
-            levels = {
-                pyramid.apply(index)._1(): geopyspark.TiledRasterLayer(
+            levels = {}
+            for index in range(0, pyramid.size()):
+                zoom_and_layer = pyramid.apply(index)
+                zoom = zoom_and_layer._1()
+                levels[zoom] = geopyspark.TiledRasterLayer(
                     geopyspark.LayerType.SPACETIME,
-                    temporal_tiled_raster_layer(option.apply(pyramid.apply(index)._1()), pyramid.apply(index)._2())
+                    temporal_tiled_raster_layer(option.apply(zoom), zoom_and_layer._2()),
                 )
-                for index in range(0, pyramid.size())
-            }
 
         if single_level:
             max_zoom = max(levels.keys())
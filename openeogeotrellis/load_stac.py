@@ -1,10 +1,12 @@
+import concurrent.futures
 import datetime as dt
 import json
 import time
 from functools import partial
 import logging
+import math
 import os
-from typing import Union, Optional, Tuple, Dict, List, Iterable, Any, Set
+from typing import Union, Optional, Tuple, Dict, List, Iterable, Iterator, Any, Set, TypeVar
 from urllib.parse import urlparse
 
 import dateutil.parser
@@ -18,6 +20,7 @@ from openeo.util import dict_no_none, Rfc3339
 import openeo_driver.backend
 from openeo_driver import filter_properties
 from openeo_driver.datacube import DriverVectorCube
+from openeo_driver.delayed_vector import DelayedVector
 from openeo_driver.backend import LoadParameters, BatchJobMetadata
 from openeo_driver.errors import (
     OpenEOApiException,
@@ -35,7 +38,9 @@ from openeo_driver.util.utm import utm_zone_from_epsg
 from openeo_driver.utils import EvalEnv
 from pathlib import Path
 from pystac import STACObject
-from shapely.geometry import Polygon, shape
+from pystac_client import ConformanceClasses
+from shapely.geometry import MultiPolygon, Polygon, mapping, shape
+from shapely.geometry.base import BaseGeometry
 
 from openeogeotrellis import datacube_parameters
 from openeogeotrellis.config import get_backend_config
@@ -48,6 +53,17 @@ from openeogeotrellis.integrations.stac import ResilientStacIO
 logger = logging.getLogger(__name__)
 REQUESTS_TIMEOUT_SECONDS = 60
 
+# Page size for STAC API item searches (overridable with the "load_stac_page_size" feature flag)
+STAC_SEARCH_PAGE_SIZE = 1000
+# Defensive cap: a single page should not become an unreasonably large response.
+STAC_SEARCH_PAGE_SIZE_MAX = 10000
+# Larger geometries are not passed as "intersects" search filter (e.g. to keep GET request URLs reasonably short).
+STAC_SEARCH_INTERSECTS_MAX_GEOJSON_SIZE = 4000
+
+T = TypeVar("T")
+
+_PROJ_FIELDS = ("proj:code", "proj:epsg", "proj:bbox", "proj:shape")
+
 
 def load_stac(
     url: str,
@@ -80,6 +96,8 @@ def load_stac(
     requested_bbox = BoundingBox.from_dict_or_none(
         load_params.spatial_extent, default_crs="EPSG:4326"
     )
+    # Reproject once (instead of for every item/collection to check) as (west, south, east, north) tuple
+    requested_bbox_lonlat = requested_bbox.reproject("EPSG:4326").as_wsen_tuple() if requested_bbox else None
 
     temporal_extent = load_params.temporal_extent
     from_date, until_date = map(dt.datetime.fromisoformat, normalize_temporal_extent(temporal_extent))
@@ -92,13 +110,10 @@ def load_stac(
             return from_date <= nominal_date <= to_date
 
         def intersects_spatially() -> bool:
-            if not requested_bbox or itm.bbox is None:
+            if not requested_bbox_lonlat or itm.bbox is None:
                 return True
 
-            requested_bbox_lonlat = requested_bbox.reproject("EPSG:4326")
-            return requested_bbox_lonlat.as_polygon().intersects(
-                Polygon.from_bounds(*itm.bbox)
-            )
+            return _bboxes_intersect(requested_bbox_lonlat, itm.bbox)
 
         return intersects_temporally() and intersects_spatially()
 
@@ -127,6 +142,15 @@ def load_stac(
             asset.media_type is None or is_supported_raster_mime_type(asset.media_type)
         )
 
+    collection_eo_bands: Dict[Optional[str], List[Union[dict, int]]] = {}
+
+    def get_collection_eo_bands(itm: pystac.Item) -> List[Union[dict, int]]:
+        # cached per collection: avoids resolving the collection and converting its summaries for every item/asset
+        collection_id = itm.collection_id
+        if collection_id not in collection_eo_bands:
+            collection_eo_bands[collection_id] = itm.get_collection().summaries.get_list("eo:bands") or []
+        return collection_eo_bands[collection_id]
+
     def get_band_names(itm: pystac.Item, asst: pystac.Asset) -> List[str]:
         def get_band_name(eo_band) -> str:
             if isinstance(eo_band, dict):
@@ -137,32 +161,35 @@ def load_stac(
             assert isinstance(eo_band, int)
             eo_band_index = eo_band
 
-            eo_bands_location = (itm.properties if "eo:bands" in itm.properties
-                                 else itm.get_collection().summaries.to_dict())
-            return get_band_name(eo_bands_location["eo:bands"][eo_band_index])
+            eo_bands = itm.properties["eo:bands"] if "eo:bands" in itm.properties else get_collection_eo_bands(itm)
+            return get_band_name(eo_bands[eo_band_index])
 
         return [get_band_name(eo_band) for eo_band in asst.extra_fields.get("eo:bands", [])]
 
-    def get_proj_metadata(itm: pystac.Item, asst: pystac.Asset) -> (Optional[int],
-                                                                    Optional[Tuple[float, float, float, float]],
-                                                                    Optional[Tuple[int, int]]):
-        """Returns EPSG code, bbox (in that EPSG) and number of pixels (rows, cols), if available."""
+    def get_proj_metadata(
+        itm: pystac.Item, asst: Optional[pystac.Asset]
+    ) -> (Optional[int], Optional[Tuple[float, float, float, float]], Optional[Tuple[int, int]]):
+        """
+        Returns EPSG code, bbox (in that EPSG) and number of pixels (rows, cols), if available.
+        Without asset, only the item-level metadata is considered.
+        """
+        asset_fields = asst.extra_fields if asst else {}
 
         def to_epsg(proj_code: str) -> Optional[int]:
             prefix = "EPSG:"
             return int(proj_code[len(prefix):]) if proj_code.upper().startswith(prefix) else None
 
         code = (
-            asst.extra_fields.get("proj:code") or itm.properties.get("proj:code") if apply_lcfm_improvements
+            asset_fields.get("proj:code") or itm.properties.get("proj:code") if apply_lcfm_improvements
             else None
         )
-        epsg = map_optional(to_epsg, code) or asst.extra_fields.get("proj:epsg") or itm.properties.get("proj:epsg")
-        bbox = asst.extra_fields.get("proj:bbox") or itm.properties.get("proj:bbox")
+        epsg = map_optional(to_epsg, code) or asset_fields.get("proj:epsg") or itm.properties.get("proj:epsg")
+        bbox = asset_fields.get("proj:bbox") or itm.properties.get("proj:bbox")
 
         if not bbox and epsg == 4326:
             bbox = itm.bbox
 
-        shape = asst.extra_fields.get("proj:shape") or itm.properties.get("proj:shape")
+        shape = asset_fields.get("proj:shape") or itm.properties.get("proj:shape")
 
         return (epsg,
                 tuple(map(float, bbox)) if bbox else None,
@@ -179,20 +206,24 @@ def load_stac(
         for property_name, condition in all_properties.items()
     }
 
-    def matches_metadata_properties(itm: pystac.Item) -> bool:
-        def operator_value(criterion: Dict[str, object]) -> (str, object):
-            if len(criterion) != 1:
-                raise ValueError(f'expected a single criterion, was {criterion}')
+    def operator_value(criterion: Dict[str, object]) -> (str, object):
+        if len(criterion) != 1:
+            raise ValueError(f'expected a single criterion, was {criterion}')
 
-            (operator, value), = criterion.items()
-            return operator, value
+        (operator, value), = criterion.items()
+        return operator, value
+
+    # Note: unpack the criteria once, not for every item.
+    literal_match_criteria = [
+        (property_name, *operator_value(criterion)) for property_name, criterion in literal_matches.items()
+    ]
 
-        for property_name, criterion in literal_matches.items():
-            if property_name not in itm.properties:
+    def matches_metadata_properties(item_properties: dict) -> bool:
+        for property_name, operator, criterion_value in literal_match_criteria:
+            if property_name not in item_properties:
                 return False
 
-            item_value = itm.properties[property_name]
-            operator, criterion_value = operator_value(criterion)
+            item_value = item_properties[property_name]
 
             if operator == 'eq' and item_value != criterion_value:
                 return False
@@ -229,10 +260,14 @@ def load_stac(
     if dependency_job_info:
         intersecting_items = []
 
+        rfc3339 = Rfc3339(propagate_none=True)
+        parse_datetime = partial(rfc3339.parse_datetime, with_timezone=True)
+
         for asset_id, asset in batch_jobs.get_result_assets(job_id=dependency_job_info.id,
                                                             user_id=user.user_id).items():
-            rfc3339 = Rfc3339(propagate_none=True)
-            parse_datetime = partial(rfc3339.parse_datetime, with_timezone=True)
+            if "data" not in asset.get("roles", []):
+                # no need to build a STAC item for non-data assets
+                continue
 
             item_geometry = asset.get("geometry", dependency_job_info.geometry)
             item_bbox = asset.get("bbox", dependency_job_info.bbox)
@@ -257,7 +292,7 @@ def load_stac(
                                           "proj:shape": asset.get("proj:shape"),
                                       }))
 
-            if intersects_spatiotemporally(pystac_item) and "data" in asset.get("roles", []):
+            if intersects_spatiotemporally(pystac_item):
                 eo_bands = [{"name": b.name} for b in asset["bands"]]
                 pystac_asset = pystac.Asset(href=asset["href"], extra_fields={"eo:bands": eo_bands})
                 pystac_item.add_asset(asset_id, pystac_asset)
@@ -323,22 +358,37 @@ def load_stac(
 
             client = pystac_client.Client.open(root_catalog.get_self_href(), modifier=modifier)
 
+            requested_fields = feature_flags.get("load_stac_fields")  # e.g. ["-properties.description"]
+            if requested_fields:
+                if client.conforms_to(ConformanceClasses.FIELDS):
+                    fields = requested_fields
+                else:
+                    logger.warning(f"ignoring fields {requested_fields!r}: STAC API does not support Fields Extension")
+
             cql2_filter = _cql2_filter(
                 client,
                 literal_matches,
                 use_filter_extension=feature_flags.get("use-filter-extension", True),
             )
 
+            search_intersects = _search_intersects(
+                load_params.aggregate_spatial_geometries, crs=requested_bbox.crs if requested_bbox else None
+            )
+
             search_request = client.search(
                 method="POST" if isinstance(cql2_filter, dict) else "GET",
                 collections=collection_id,
-                bbox=requested_bbox.reproject("EPSG:4326").as_wsen_tuple() if requested_bbox else None,
-                limit=20,
+                # Note: STAC API allows only one of "bbox" and "intersects".
+                **(
+                    {"intersects": search_intersects}
+                    if search_intersects
+                    else {"bbox": requested_bbox_lonlat}
+                ),
+                limit=_search_page_size(feature_flags.get("load_stac_page_size")),
                 datetime=(
                     None
                     if ((temporal_extent is DEFAULT_TEMPORAL_EXTENT) or netcdf_with_time_dimension)
-                    else f"{from_date.isoformat().replace('+00:00', 'Z')}/"
-                    f"{to_date.isoformat().replace('+00:00', 'Z')}"  # end is inclusive
+                    else f"{_format_utc(from_date)}/{_format_utc(to_date)}"  # end is inclusive
                 ),
                 filter=cql2_filter,
                 fields=fields,
@@ -352,8 +402,23 @@ def load_stac(
             else:
                 logger.info(f"STAC API request: {search_request.method} {search_request.url_with_parameters()}")
 
-            # STAC API might not support Filter Extension so always use client-side filtering as well
-            intersecting_items = filter(matches_metadata_properties, search_request.items())
+            # STAC API supports Filter Extension (and the CQL2 encoding of the filter): rely on server-side filtering
+            filtered_server_side = cql2_filter is not None and _supports_cql2_filter(client, cql2_filter)
+
+            def search_pages() -> Iterator[pystac.ItemCollection]:
+                for page in search_request.pages_as_dicts():
+                    if not filtered_server_side:
+                        # STAC API might not support Filter Extension so use client-side filtering as well;
+                        # do this on the raw features to avoid building Items that would be discarded anyway.
+                        page["features"] = [
+                            feature
+                            for feature in page.get("features", [])
+                            if matches_metadata_properties(feature.get("properties", {}))
+                        ]
+                    yield pystac.ItemCollection.from_dict(page, preserve_dict=False, root=client)
+
+            # Fetch and parse the next page of search results in the background while processing the current one.
+            intersecting_items = (itm for page in _prefetched(search_pages()) for itm in page)
         else:
             assert isinstance(stac_object, pystac.Catalog)  # static Catalog + Collection
             catalog = stac_object
@@ -370,27 +435,24 @@ def load_stac(
                                               else catalog.extra_fields.get("summaries", {})).get("eo:bands", [])]
 
             def intersecting_catalogs(root: pystac.Catalog) -> Iterable[pystac.Catalog]:
-                def intersects_spatiotemporally(coll: pystac.Collection) -> bool:
-                    def intersects_spatially(bbox) -> bool:
-                        if not requested_bbox:
-                            return True
+                def intersects_spatially(bbox) -> bool:
+                    if not requested_bbox_lonlat:
+                        return True
 
-                        requested_bbox_lonlat = requested_bbox.reproject("EPSG:4326")
-                        return requested_bbox_lonlat.as_polygon().intersects(
-                            Polygon.from_bounds(*bbox)
-                        )
+                    return _bboxes_intersect(requested_bbox_lonlat, bbox)
 
-                    def intersects_temporally(interval) -> bool:
-                        start, end = interval
+                def intersects_temporally(interval) -> bool:
+                    start, end = interval
 
-                        if start is not None and end is not None:
-                            return to_date >= start and from_date <= end
-                        if start is not None:
-                            return to_date >= start
-                        if end is not None:
-                            return from_date <= end
-                        return True
+                    if start is not None and end is not None:
+                        return to_date >= start and from_date <= end
+                    if start is not None:
+                        return to_date >= start
+                    if end is not None:
+                        return from_date <= end
+                    return True
 
+                def intersects_spatiotemporally(coll: pystac.Collection) -> bool:
                     bboxes = coll.extent.spatial.bboxes
                     intervals = coll.extent.temporal.intervals
 
@@ -410,9 +472,27 @@ def load_stac(
                 if isinstance(root, pystac.Collection) and not intersects_spatiotemporally(root):
                     return []
 
+                def might_intersect(child_link: pystac.Link) -> bool:
+                    # Cheap check on extent hints in the child link itself (if any), to avoid fetching the child.
+                    bbox = child_link.extra_fields.get("bbox")
+                    if isinstance(bbox, list) and len(bbox) == 4 and not intersects_spatially(bbox):
+                        return False
+
+                    interval = child_link.extra_fields.get("temporal")
+                    if isinstance(interval, list) and len(interval) == 2:
+                        try:
+                            interval = [map_optional(_parse_utc_datetime, d) for d in interval]
+                        except (TypeError, ValueError):
+                            return True
+                        return intersects_temporally(interval)
+
+                    return True
+
                 yield root
-                for child in root.get_children():
-                    yield from intersecting_catalogs(child)
+                for child_link in root.get_links(pystac.RelType.CHILD):
+                    if might_intersect(child_link):
+                        child_link.resolve_stac_object(root=root.get_root())
+                        yield from intersecting_catalogs(child_link.target)
 
             intersecting_items = (
                 itm
@@ -425,7 +505,10 @@ def load_stac(
 
     opensearch_client = jvm.org.openeo.geotrellis.file.FixedFeaturesOpenSearchClient()
 
-    stac_bbox = None
+    # Union of the item bboxes (as plain WSEN coordinates, in the CRS of the first item);
+    # stac_bbox_crs is only set once an item with a bbox was seen.
+    stac_w, stac_s, stac_e, stac_n = math.inf, math.inf, -math.inf, -math.inf
+    stac_bbox_crs = None
     items_found = False
     start_datetime = end_datetime = None
     proj_epsg = None
@@ -435,6 +518,10 @@ def load_stac(
     band_cell_size: Dict[str, Tuple[float, float]] = {}  # assumes a band has the same resolution across features/assets
     band_epsgs: Dict[str, Set[int]] = {}
 
+    band_names_seen = set(band_names)  # for fast membership checks while preserving the order of band_names
+
+    # Note: resolve the JVM class once instead of for every item (each lookup is a py4j round-trip).
+    open_search_responses = jvm.org.openeo.opensearch.OpenSearchResponses
 
     for itm in intersecting_items:
         items_found = True
@@ -447,20 +534,26 @@ def load_stac(
         if not end_datetime or item_end_datetime > end_datetime:
             end_datetime = item_end_datetime
 
-        band_assets = {
-            asset_id: asset for asset_id, asset in dict(sorted(itm.assets.items())).items() if is_band_asset(asset)
-        }
+        band_assets = {asset_id: asset for asset_id, asset in sorted(itm.assets.items()) if is_band_asset(asset)}
 
-        builder = (jvm.org.openeo.opensearch.OpenSearchResponses.featureBuilder()
+        builder = (open_search_responses.featureBuilder()
                    .withId(itm.id)
                    .withNominalDate(itm.properties.get("datetime") or itm.properties["start_datetime"]))
 
+        item_proj_metadata = None
         for asset_id, asset in band_assets.items():
             asset_band_names = get_band_names(itm, asset) or [asset_id]
-            proj_epsg, proj_bbox, proj_shape = get_proj_metadata(itm, asset)
+            if any(field in asset.extra_fields for field in _PROJ_FIELDS):
+                proj_epsg, proj_bbox, proj_shape = get_proj_metadata(itm, asset)
+            else:
+                # same for all assets without their own projection metadata
+                if item_proj_metadata is None:
+                    item_proj_metadata = get_proj_metadata(itm, None)
+                proj_epsg, proj_bbox, proj_shape = item_proj_metadata
 
             for asset_band_name in asset_band_names:
-                if asset_band_name not in band_names:
+                if asset_band_name not in band_names_seen:
+                    band_names_seen.add(asset_band_name)
                     band_names.append(asset_band_name)
 
                 if proj_bbox and proj_shape:
@@ -495,9 +588,18 @@ def load_stac(
 
         opensearch_client.addFeature(builder.build())
 
-        stac_bbox = (item_bbox if stac_bbox is None
-                     else BoundingBox.from_wsen_tuple(item_bbox.as_polygon().union(stac_bbox.as_polygon()).bounds,
-                                                      stac_bbox.crs))
+        if item_bbox is not None:
+            item_w, item_s, item_e, item_n = item_bbox.as_wsen_tuple()
+            stac_w, stac_s = min(stac_w, item_w), min(stac_s, item_s)
+            stac_e, stac_n = max(stac_e, item_e), max(stac_n, item_n)
+            if stac_bbox_crs is None:
+                stac_bbox_crs = item_bbox.crs
+
+    stac_bbox = (
+        BoundingBox.from_wsen_tuple((stac_w, stac_s, stac_e, stac_n), crs=stac_bbox_crs)
+        if stac_bbox_crs is not None
+        else None
+    )
 
     if not allow_empty_cubes and not items_found:
         raise no_data_available_exception
@@ -655,23 +757,25 @@ def load_stac(
     if tilesize:
         getattr(data_cube_parameters, "tileSize_$eq")(tilesize)
 
+    from_date_iso, to_date_iso = from_date.isoformat(), to_date.isoformat()
+
     if netcdf_with_time_dimension:
-        pyramid = pyramid_factory.datacube_seq(projected_polygons, from_date.isoformat(), to_date.isoformat(),
+        pyramid = pyramid_factory.datacube_seq(projected_polygons, from_date_iso, to_date_iso,
                                                metadata_properties, correlation_id, data_cube_parameters,
                                                opensearch_client)
     elif single_level:
         if not items_found and allow_empty_cubes:
             pyramid = pyramid_factory.empty_datacube_seq(
                 projected_polygons,
-                from_date.isoformat(),
-                to_date.isoformat(),
+                from_date_iso,
+                to_date_iso,
                 data_cube_parameters,
             )
         else:
             pyramid = pyramid_factory.datacube_seq(
                 projected_polygons,
-                from_date.isoformat(),
-                to_date.isoformat(),
+                from_date_iso,
+                to_date_iso,
                 metadata_properties,
                 correlation_id,
                 data_cube_parameters,
@@ -685,13 +789,13 @@ def load_stac(
             extent_crs = "EPSG:4326"
 
         if not items_found and allow_empty_cubes:
-            pyramid = pyramid_factory.empty_pyramid_seq(extent, extent_crs, from_date.isoformat(), to_date.isoformat())
+            pyramid = pyramid_factory.empty_pyramid_seq(extent, extent_crs, from_date_iso, to_date_iso)
         else:
             pyramid = pyramid_factory.pyramid_seq(
-                extent, extent_crs, from_date.isoformat(), to_date.isoformat(), metadata_properties, correlation_id
+                extent, extent_crs, from_date_iso, to_date_iso, metadata_properties, correlation_id
             )
 
-    metadata = metadata.filter_temporal(from_date.isoformat(), to_date.isoformat())
+    metadata = metadata.filter_temporal(from_date_iso, to_date_iso)
 
     metadata = metadata.filter_bbox(
         west=extent.xmin(),
@@ -704,10 +808,15 @@ def load_stac(
     temporal_tiled_raster_layer = jvm.geopyspark.geotrellis.TemporalTiledRasterLayer
     option = jvm.scala.Option
 
-    # noinspection PyProtectedMember
-    levels = {pyramid.apply(index)._1(): TiledRasterLayer(LayerType.SPACETIME, temporal_tiled_raster_layer(
-        option.apply(pyramid.apply(index)._1()), pyramid.apply(index)._2())) for index in
-              range(0, pyramid.size())}
+    levels = {}
+    for index in range(0, pyramid.size()):
+        # Note: minimize JVM round-trips by resolving the (zoom, layer) tuple only once
+        # noinspection PyProtectedMember
+        zoom_and_layer = pyramid.apply(index)
+        zoom = zoom_and_layer._1()
+        levels[zoom] = TiledRasterLayer(
+            LayerType.SPACETIME, temporal_tiled_raster_layer(option.apply(zoom), zoom_and_layer._2())
+        )
 
     return GeopysparkDataCube(pyramid=gps.Pyramid(levels), metadata=metadata)
 
@@ -774,10 +883,96 @@ def _compute_cellsize(
     return cell_width, cell_height
 
 
+def _prefetched(iterable: Iterable[T]) -> Iterator[T]:
+    """
+    Iterate over given iterable, while already fetching its next element in a background thread,
+    e.g. to overlap fetching the next page of (STAC API) search results with processing the current one.
+    """
+    iterator = iter(iterable)
+    exhausted = object()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(next, iterator, exhausted)
+        while True:
+            element = future.result()
+            if element is exhausted:
+                return
+            future = executor.submit(next, iterator, exhausted)
+            yield element
+
+
+def _parse_utc_datetime(value: str) -> dt.datetime:
+    date_time = dateutil.parser.isoparse(value)
+    return date_time if date_time.tzinfo else date_time.replace(tzinfo=dt.timezone.utc)
+
+
+def _search_intersects(
+    geometries: Union[BaseGeometry, DriverVectorCube, DelayedVector, None], crs: Optional[str] = None
+) -> Optional[dict]:
+    """
+    GeoJSON geometry to pass as "intersects" STAC API search filter (instead of a "bbox"),
+    if the geometries are (small enough) polygons in lon/lat.
+
+    :param geometries: vector cube (with its own CRS) or bare shapely geometry.
+    :param crs: CRS of a bare shapely geometry (that of the spatial extent);
+        a bare geometry is only used if this is EPSG:4326.
+    """
+    if isinstance(geometries, DriverVectorCube):
+        if (
+            geometries.geometry_count() == 0
+            or geometries.get_crs() != pyproj.CRS.from_epsg(4326)
+            or not all(isinstance(g, (Polygon, MultiPolygon)) for g in geometries.get_geometries())
+        ):
+            return None
+        geometries = geometries.to_multipolygon()
+    elif crs is None or pyproj.CRS.from_user_input(crs) != pyproj.CRS.from_epsg(4326):
+        return None
+
+    if not isinstance(geometries, (Polygon, MultiPolygon)):
+        # Note: points are buffered when loading, so they can't be used as-is.
+        return None
+
+    geojson = mapping(geometries)
+    if len(json.dumps(geojson)) > STAC_SEARCH_INTERSECTS_MAX_GEOJSON_SIZE:
+        return None
+    return geojson
+
+
+def _format_utc(date_time: dt.datetime) -> str:
+    """Formats as RFC 3339 UTC timestamp with "Z" suffix, keeping sub-second precision (if any)."""
+    if date_time.tzinfo is not None:
+        date_time = date_time.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return date_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ" if date_time.microsecond else "%Y-%m-%dT%H:%M:%SZ")
+
+
+def _search_page_size(requested: Optional[int]) -> int:
+    if requested is None:
+        return STAC_SEARCH_PAGE_SIZE
+    return max(1, min(int(requested), STAC_SEARCH_PAGE_SIZE_MAX))
+
+
+def _bboxes_intersect(bbox: Iterable[float], other: Iterable[float]) -> bool:
+    """
+    Check if two (west, south, east, north) bounding boxes intersect (touching counts as intersecting),
+    with plain coordinate comparisons instead of constructing shapely geometries.
+    """
+    xmin, ymin, xmax, ymax = bbox
+    other_xmin, other_ymin, other_xmax, other_ymax = other
+    return (
+        min(xmin, xmax) <= max(other_xmin, other_xmax)
+        and min(other_xmin, other_xmax) <= max(xmin, xmax)
+        and min(ymin, ymax) <= max(other_ymin, other_ymax)
+        and min(other_ymin, other_ymax) <= max(ymin, ymax)
+    )
+
+
 def extract_own_job_info(
     url: str, user_id: str, batch_jobs: openeo_driver.backend.BatchJobs
 ) -> Optional[BatchJobMetadata]:
-    path_segments = urlparse(url).path.split("/")
+    if "/jobs/" not in url:
+        # Cheap rejection of e.g. regular STAC URLs.
+        return None
+
+    path_segments = urlparse(url).path.rsplit("/", maxsplit=3)
 
     if len(path_segments) < 3:
         return None
@@ -897,6 +1092,18 @@ def _cql2_filter(
     return None  # explicitly disabled
 
 
+def _supports_cql2_filter(client: pystac_client.Client, cql2_filter: Union[str, dict]) -> bool:
+    """
+    Does the STAC API advertise support for the Filter Extension
+    and the CQL2 encoding of given filter (CQL2 JSON for a dict, CQL2 text for a string)?
+    """
+    if not client.conforms_to(ConformanceClasses.FILTER):
+        return False
+    # e.g. "http://www.opengis.net/spec/cql2/1.0/conf/cql2-json"
+    encoding = "cql2-json" if isinstance(cql2_filter, dict) else "cql2-text"
+    return any(uri.endswith(f"/{encoding}") for uri in client.get_conforms_to())
+
+
 def _cql2_text_filter(literal_matches: Dict[str, Dict[str, Any]]) -> str:
     cql2_text_formatter = get_jvm().org.openeo.geotrellissentinelhub.Cql2TextFormatter()
 
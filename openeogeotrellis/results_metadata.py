@@ -0,0 +1,55 @@
+"""
+Batch job output directory layout and loading of batch job results metadata
+(the "job_metadata.json" file in the job directory),
+without having to construct a full `GpsBatchJobs` instance.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Union
+
+from openeogeotrellis.configparams import ConfigParams
+from openeogeotrellis.utils import get_s3_file_contents
+
+JOB_METADATA_FILENAME = "job_metadata.json"
+
+_log = logging.getLogger(__name__)
+
+
+def get_job_output_dir(output_root_dir: Union[str, Path], job_id: str) -> Path:
+    # TODO: instead of flat dir with potentially a lot of subdirs (which is hard to maintain/clean up):
+    #       add an intermediate level (e.g. based on job_id/user_id prefix or date or ...)?
+    # TODO: this so called "output" dir is also being used for "input" (e.g. specification file, UDF deps, ...),
+    #       so "work dir" would be a better name. Also see `GpsBatchJobs.get_job_work_dir`.
+    return Path(output_root_dir) / job_id
+
+
+def get_results_metadata_path(output_root_dir: Union[str, Path], job_id: str) -> Path:
+    return get_job_output_dir(output_root_dir=output_root_dir, job_id=job_id) / JOB_METADATA_FILENAME
+
+
+def load_results_metadata(output_root_dir: Union[str, Path], job_id: str) -> dict:
+    """
+    Reads the metadata json file from the job directory and returns it.
+    """
+    metadata_file = get_results_metadata_path(output_root_dir=output_root_dir, job_id=job_id)
+
+    if ConfigParams().use_object_storage:
+        try:
+            contents = get_s3_file_contents(str(metadata_file))
+            return json.loads(contents)
+        except Exception:
+            _log.warning(
+                "Could not retrieve result metadata from object storage %s",
+                metadata_file, exc_info=True,
+                extra={'job_id': job_id})
+
+    try:
+        with open(metadata_file) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        _log.warning("Could not derive result metadata from %s", metadata_file, exc_info=True,
+                     extra={'job_id': job_id})
+
+    return {}
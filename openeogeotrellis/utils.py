@@ -21,6 +21,7 @@ from pathlib import Path
 from typing import Callable, Iterable, Optional, Tuple, Union, Dict, Any, TypeVar
 
 import dateutil.parser
+import numpy as np
 import pyproj
 import pytz
 from epsel import on_first_time
@@ -97,21 +98,27 @@ def dict_merge_recursive(a: collections.abc.Mapping, b: collections.abc.Mapping,
 
     # TODO move this to utils module in openeo-python-driver or openeo-python-client?
     """
-    # Start with shallow copy, we'll copy deeper parts where necessary through recursion.
+    # Start with shallow copy, we'll copy deeper parts where necessary.
     result = dict(a)
-    for key, value in b.items():
-        if key in result:
-            if isinstance(value, collections.abc.Mapping) and isinstance(result[key], collections.abc.Mapping):
-                result[key] = dict_merge_recursive(result[key], value, overwrite=overwrite)
-            elif overwrite:
-                result[key] = value
-            elif result[key] == value:
-                pass
+    # Work list of (target, source) pairs instead of recursion: target is a copy we own and can update in place.
+    todo = [(result, b)]
+    while todo:
+        target, source = todo.pop()
+        for key, value in source.items():
+            if key in target:
+                current = target[key]
+                if isinstance(value, collections.abc.Mapping) and isinstance(current, collections.abc.Mapping):
+                    target[key] = merged = dict(current)
+                    todo.append((merged, value))
+                elif overwrite:
+                    target[key] = value
+                elif current == value:
+                    pass
+                else:
+                    raise ValueError("Can not automatically merge values {a!r} and {b!r} for key {k!r}"
+                                     .format(a=current, b=value, k=key))
             else:
-                raise ValueError("Can not automatically merge values {a!r} and {b!r} for key {k!r}"
-                                 .format(a=result[key], b=value, k=key))
-        else:
-            result[key] = value
+                target[key] = value
     return result
 
 
@@ -167,24 +174,35 @@ def utcnow_epoch() -> float:
     return utcnow().timestamp()
 
 
+@functools.lru_cache(maxsize=128)
+def _user_name(uid: int) -> str:
+    return pwd.getpwuid(uid).pw_name
+
+
+@functools.lru_cache(maxsize=128)
+def _group_name(gid: int) -> str:
+    return grp.getgrgid(gid).gr_name
+
+
 def describe_path(path: Union[Path, str]) -> dict:
     path = Path(path)
-    if path.exists() or path.is_symlink():
-        st = os.stat(str(path))
-        return {
-            "path": str(path.absolute()),
-            "mode": stat.filemode(st.st_mode),
-            "uid": st.st_uid,
-            "user": pwd.getpwuid(st.st_uid).pw_name,
-            "gid": st.st_gid,
-            "group": grp.getgrgid(st.st_gid).gr_name,
-            "size": st.st_size
-        }
-    else:
+    try:
+        # Single stat call instead of separate existence checks first.
+        st = os.stat(path)
+    except FileNotFoundError:
         return {
             "path": str(path),
             "status": "does not exist"
         }
+    return {
+        "path": str(path.absolute()),
+        "mode": stat.filemode(st.st_mode),
+        "uid": st.st_uid,
+        "user": _user_name(st.st_uid),
+        "gid": st.st_gid,
+        "group": _group_name(st.st_gid),
+        "size": st.st_size
+    }
 
 
 def to_projected_polygons(
@@ -422,6 +440,29 @@ def lonlat_to_mercator_tile_indices(
     return tx, ty
 
 
+def lonlat_to_mercator_tile_indices_batch(
+    longitudes, latitudes, zoom: int, tile_size: int = 512, flip_y: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized version of `lonlat_to_mercator_tile_indices` for sequences/arrays of coordinates.
+
+    :return: (tx, ty) arrays of mercator tile indices
+    """
+    longitudes = np.asarray(longitudes, dtype=float)
+    latitudes = np.asarray(latitudes, dtype=float)
+    offset = 2 * math.pi * 6378137 / 2.0
+    mx = longitudes * offset / 180
+    my = (np.log(np.tan((90 + latitudes) * math.pi / 360)) / (math.pi / 180.0)) * offset / 180
+    resolution = 2 * math.pi * 6378137 / tile_size / (2 ** zoom)
+    px = (mx + offset) / resolution
+    py = (my + offset) / resolution
+    tx = np.ceil(px / tile_size).astype(int) - 1
+    ty = np.ceil(py / tile_size).astype(int) - 1
+    if flip_y:
+        ty = (2 ** zoom - 1) - ty
+    return tx, ty
+
+
 @contextlib.contextmanager
 def nullcontext():
     """
@@ -616,7 +657,9 @@ class StatsReporter:
         report: Union[Callable[[str], None], logging.Logger] = logger,
     ):
         self.name = name
+        self._logger = None
         if isinstance(report, logging.Logger):
+            self._logger = report
             report = report.info
         self.report = report
         self.stats = None
@@ -626,6 +669,9 @@ class StatsReporter:
         return self.stats
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._logger and not self._logger.isEnabledFor(logging.INFO):
+            # Don't bother serializing stats that won't be logged anyway.
+            return
         self.report(f"{self.name}: {json.dumps(self.stats)}")
 
 
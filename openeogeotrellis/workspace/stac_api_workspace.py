@@ -45,6 +45,7 @@ class StacApiWorkspace(Workspace):
         self._get_access_token = get_access_token
         self._export_asset = export_asset
         self._asset_alternate_id = asset_alternate_id
+        self._catalog_supports_necessary_api = False  # checked (once) upon first merge
 
     def import_file(self, common_path: Union[str, Path], file: Path, merge: str, remove_original: bool = False) -> str:
         raise NotImplementedError
@@ -179,6 +180,9 @@ class StacApiWorkspace(Workspace):
                 raise
 
     def _assert_catalog_supports_necessary_api(self):
+        if self._catalog_supports_necessary_api:
+            return
+
         # TODO: reduce code duplication with openeo_driver.util.http.requests_with_retry
         retry = requests.adapters.Retry(
             total=3,
@@ -208,6 +212,8 @@ class StacApiWorkspace(Workspace):
         if not supports_item_methods:
             raise ValueError(f"{self.root_url} does not support Transaction extension for Items")
 
+        self._catalog_supports_necessary_api = True
+
     def _is_not_found_error(self, e: BaseException) -> bool:
         return (isinstance(e, requests.HTTPError) and e.response.status_code == 404) or (
             e.__cause__ is not None and self._is_not_found_error(e.__cause__)
@@ -1,18 +1,21 @@
+import os
 import textwrap
 from pathlib import Path
 
-import attrs
 import pytest
 from openeo_driver.config.config import check_config_definition
 
 from openeogeotrellis.config import GpsBackendConfig, get_backend_config
 
-SIMPLE_CONFIG = """
+SIMPLE_CONFIG = textwrap.dedent(
+    """
     from openeogeotrellis.config import GpsBackendConfig
     config = GpsBackendConfig()
     """
+)
 
-CUSTOM_CONFIG = """
+CUSTOM_CONFIG = textwrap.dedent(
+    """
     import attrs
     from openeogeotrellis.config import GpsBackendConfig
 
@@ -22,13 +25,14 @@ CUSTOM_CONFIG = """
 
     config = CustomConfig()
     """
+)
 
 
 def get_config_file(
     tmp_path: Path, content: str = SIMPLE_CONFIG, filename: str = "testconfig.py"
 ) -> Path:
     config_path = tmp_path / filename
-    config_path.write_text(textwrap.dedent(content))
+    config_path.write_text(content)
     return config_path
 
 
@@ -41,7 +45,13 @@ class TestGpsBackendConfig:
         config = GpsBackendConfig()
         assert isinstance(config, GpsBackendConfig)
 
+    def test_slots(self):
+        config = GpsBackendConfig()
+        assert not hasattr(config, "__dict__")
+
     def test_immutability(self):
+        import attrs
+
         config = GpsBackendConfig(id="foo")
         assert config.id == "foo"
         with pytest.raises(attrs.exceptions.FrozenInstanceError):
@@ -51,36 +61,56 @@ class TestGpsBackendConfig:
         assert config.id == "foo"
 
 
+@pytest.fixture(scope="module")
+def config_dir(tmp_path_factory) -> Path:
+    """Directory for config files shared by the tests of a module (use distinct file names per test)."""
+    return tmp_path_factory.mktemp("gpsconfig")
+
+
+@pytest.fixture(scope="class")
+def flush_backend_config_after_class():
+    # Don't leak config loaded in these tests to other tests
+    yield
+    get_backend_config.flush()
+
+
+@pytest.mark.usefixtures("flush_backend_config_after_class")
 class TestGetGpsBackendConfig:
     @pytest.fixture(autouse=True)
     def _flush_get_backend_config(self):
-        # Make sure config cached is cleared before and after each test
-        get_backend_config.flush()
-        yield
+        # Make sure each test starts without cached config
         get_backend_config.flush()
 
     def test_get_backend_config_default(self, tmp_path):
         config = get_backend_config()
         assert isinstance(config, GpsBackendConfig)
 
-    def test_get_backend_config_custom(self, tmp_path, monkeypatch):
+    @pytest.fixture
+    def custom_config_env(self, config_dir, monkeypatch, request) -> Path:
+        """Custom config file (with id from indirect parametrization), set as OPENEO_BACKEND_CONFIG."""
         config_path = get_config_file(
-            tmp_path=tmp_path, content=CUSTOM_CONFIG.format(id="custom")
+            tmp_path=config_dir, content=CUSTOM_CONFIG.format(id=request.param), filename=f"{request.node.name}.py"
         )
         monkeypatch.setenv("OPENEO_BACKEND_CONFIG", str(config_path))
+        return config_path
+
+    @pytest.mark.parametrize(
+        ["custom_config_env", "expected_id"],
+        [
+            ("custom", "custom"),
+            ("lazy+cache", "lazy+cache"),
+        ],
+        indirect=["custom_config_env"],
+    )
+    def test_get_backend_config_custom(self, custom_config_env, expected_id):
         config = get_backend_config()
         assert isinstance(config, GpsBackendConfig)
         assert type(config).__name__ == "CustomConfig"
-        assert config.id == "custom"
+        assert config.id == expected_id
 
-    def test_get_backend_config_lazy_cache(self, tmp_path, monkeypatch):
-        config_path = get_config_file(
-            tmp_path=tmp_path, content=CUSTOM_CONFIG.format(id="lazy+cache")
-        )
-        monkeypatch.setenv("OPENEO_BACKEND_CONFIG", str(config_path))
+    @pytest.mark.parametrize("custom_config_env", ["lazy+cache"], indirect=True)
+    def test_get_backend_config_lazy_cache(self, custom_config_env):
         config = get_backend_config()
-        assert isinstance(config, GpsBackendConfig)
-        assert type(config).__name__ == "CustomConfig"
         assert config.id == "lazy+cache"
 
         # Second call without changes
@@ -88,9 +118,12 @@ class TestGetGpsBackendConfig:
 
         # Overwrite config file
         config_path = get_config_file(
-            tmp_path=tmp_path, content=CUSTOM_CONFIG.format(id="something else")
+            tmp_path=custom_config_env.parent,
+            content=CUSTOM_CONFIG.format(id="something else"),
+            filename=custom_config_env.name,
         )
-        monkeypatch.setenv("OPENEO_BACKEND_CONFIG", str(config_path))
+        # Note: OPENEO_BACKEND_CONFIG still points to the (overwritten) config file
+        assert os.environ["OPENEO_BACKEND_CONFIG"] == str(config_path)
         assert get_backend_config() is config
 
         # Remove config file
@@ -101,6 +134,52 @@ class TestGetGpsBackendConfig:
         with pytest.raises(FileNotFoundError):
             _ = get_backend_config(force_reload=True)
 
+    @pytest.mark.parametrize("custom_config_env", ["reload"], indirect=True)
+    def test_get_backend_config_force_reload(self, custom_config_env):
+        config = get_backend_config()
+        assert config.id == "reload"
+
+        # Unchanged config file: still re-executed
+        reloaded = get_backend_config(force_reload=True)
+        assert reloaded is not config
+        assert reloaded.id == "reload"
+
+        get_config_file(
+            tmp_path=custom_config_env.parent,
+            content=CUSTOM_CONFIG.format(id="reloaded"),
+            filename=custom_config_env.name,
+        )
+        reloaded = get_backend_config(force_reload=True)
+        assert reloaded is not config
+        assert reloaded.id == "reloaded"
+
+    def test_get_backend_config_force_reload_env_dependent(self, config_dir, monkeypatch):
+        config_path = get_config_file(
+            tmp_path=config_dir,
+            content=textwrap.dedent(
+                """
+                import os
+                from openeogeotrellis.config import GpsBackendConfig
+                config = GpsBackendConfig(id=os.environ.get("CFG_ID", "a"))
+                """
+            ),
+            filename="env_dependent.py",
+        )
+        monkeypatch.setenv("OPENEO_BACKEND_CONFIG", str(config_path))
+        assert get_backend_config().id == "a"
+
+        # Unchanged config file, but values computed at load time must be re-evaluated
+        monkeypatch.setenv("CFG_ID", "b")
+        assert get_backend_config().id == "a"
+        assert get_backend_config(force_reload=True).id == "b"
+
+    def test_get_backend_config_without_py_suffix(self, config_dir, monkeypatch):
+        config_path = get_config_file(
+            tmp_path=config_dir, content=CUSTOM_CONFIG.format(id="no-suffix"), filename="no_suffix_config"
+        )
+        monkeypatch.setenv("OPENEO_BACKEND_CONFIG", str(config_path))
+        assert get_backend_config().id == "no-suffix"
+
     def test_default_config(self, monkeypatch):
         monkeypatch.delenv("OPENEO_BACKEND_CONFIG")
         config = get_backend_config()
@@ -12,7 +12,9 @@ from unittest import mock
 
 import kubernetes
 import pytest
+import requests
 import requests_mock
+import responses
 from openeo.util import rfc3339, url_join
 from openeo_driver.testing import DictSubSet
 from openeo_driver.utils import generate_unique_id
@@ -24,12 +26,14 @@ from openeogeotrellis.integrations.yarn import YARN_FINAL_STATUS, YARN_STATE
 from openeogeotrellis.job_costs_calculator import CostsDetails
 from openeogeotrellis.job_registry import InMemoryJobRegistry, ZkJobRegistry
 from openeogeotrellis.job_tracker_v2 import (
+    AppNotFound,
     JobCostsCalculator,
     JobTracker,
     K8sStatusGetter,
     YarnAppReportParseException,
     YarnStatusGetter,
 )
+from openeogeotrellis.results_metadata import get_results_metadata_path
 from openeogeotrellis.testing import KazooClientMock, gps_config_overrides
 from openeogeotrellis.utils import json_write
 
@@ -379,8 +383,6 @@ class TestYarnJobTracker:
         job_tracker = JobTracker(
             app_state_getter=YarnStatusGetter(ConfigParams().yarn_rest_api_base_url),
             zk_job_registry=zk_job_registry,
-            principal="john@EXAMPLE.TEST",
-            keytab="test/openeo.keytab",
             job_costs_calculator=job_costs_calculator,
             output_root_dir=batch_job_output_root,
             elastic_job_registry=elastic_job_registry,
@@ -390,6 +392,7 @@ class TestYarnJobTracker:
     @pytest.mark.parametrize("job_options", [None, DUMMY_JOB_OPTIONS])
     def test_yarn_zookeeper_basic(
         self,
+        batch_job_output_root,
         zk_job_registry,
         yarn_mock,
         job_tracker,
@@ -483,7 +486,8 @@ class TestYarnJobTracker:
             {
                 "status": "queued",
                 "created": "2022-12-14T12:00:00Z",
-                "updated": "2022-12-14T12:02:20Z",
+                # No change in status: no status update
+                "updated": "2022-12-14T12:01:10Z",
             }
         )
 
@@ -511,7 +515,7 @@ class TestYarnJobTracker:
         time_machine.coordinates.shift(70)
         yarn_app.set_finished()
         json_write(
-            path=job_tracker._batch_jobs.get_results_metadata_path(job_id=job_id),
+            path=get_results_metadata_path(batch_job_output_root, job_id=job_id),
             data={
                 "foo": "bar",
                 "usage": {"input_pixel": {"unit": "mega-pixel", "value": 1.125}}
@@ -572,6 +576,53 @@ class TestYarnJobTracker:
 
         assert caplog.record_tuples == []
 
+    def test_yarn_zookeeper_refresh_unchanged_status(
+        self, zk_job_registry, yarn_mock, job_tracker, elastic_job_registry, time_machine
+    ):
+        time_machine.move_to("2022-12-14T12:00:00Z", tick=False)
+        job_id = "job-123"
+        user_id = "john"
+        zk_job_registry.register(
+            job_id=job_id,
+            user_id=user_id,
+            api_version="1.2.3",
+            specification=ZkJobRegistry.build_specification_dict(process_graph=DUMMY_PG_1),
+        )
+        zk_job_registry.set_application_id(job_id=job_id, user_id=user_id, application_id="app-123")
+        elastic_job_registry.create_job(job_id=job_id, user_id=user_id, process=DUMMY_PROCESS_1)
+        yarn_mock.submit(app_id="app-123", state=YARN_STATE.RUNNING)
+
+        job_tracker.update_statuses()
+        assert elastic_job_registry.db[job_id] == DictSubSet(status="running", updated="2022-12-14T12:00:00Z")
+
+        # Nothing changed: no status update
+        time_machine.move_to("2022-12-14T12:10:00Z", tick=False)
+        job_tracker.update_statuses()
+        assert elastic_job_registry.db[job_id] == DictSubSet(status="running", updated="2022-12-14T12:00:00Z")
+
+        # Nothing changed, but "updated" timestamp is due for a refresh
+        time_machine.move_to("2022-12-14T14:00:00Z", tick=False)
+        job_tracker.update_statuses()
+        assert elastic_job_registry.db[job_id] == DictSubSet(status="running", updated="2022-12-14T14:00:00Z")
+
+    @pytest.mark.parametrize(
+        ["updated", "expected"],
+        [
+            ("2022-12-14T11:30:00Z", False),
+            ("2022-12-14T11:30:00.123Z", False),
+            ("2022-12-14T13:30:00+02:00", False),
+            ("2022-12-14T11:30:00", False),
+            ("2022-12-14T10:30:00Z", True),
+            ("2022-12-14T12:30:00+02:00", True),
+            ("2022-12-14T06:30:00-04:00", True),
+            (None, True),
+            ("nope", True),
+        ],
+    )
+    def test_status_refresh_due(self, time_machine, updated, expected):
+        time_machine.move_to("2022-12-14T12:00:00Z", tick=False)
+        assert JobTracker._status_refresh_due({"updated": updated}) == expected
+
     def test_yarn_zookeeper_lost_yarn_app(
         self,
         zk_job_registry,
@@ -843,6 +894,7 @@ class TestYarnJobTracker:
             "new metadata": 2,
             "status same": 2,
             "status same 'running'": 2,
+            "skip status update (no change)": 2,
         }
 
     @pytest.mark.parametrize("job_options", [None, DUMMY_JOB_OPTIONS])
@@ -868,6 +920,7 @@ class TestYarnJobTracker:
     )
     def test_yarn_zookeeper_job_cost(
         self,
+        batch_job_output_root,
         zk_job_registry,
         yarn_mock,
         job_tracker,
@@ -909,7 +962,7 @@ class TestYarnJobTracker:
         yarn_app.set_state(yarn_state, yarn_final_state)
         yarn_app.set_finish_time()
         json_write(
-            path=job_tracker._batch_jobs.get_results_metadata_path(job_id=job_id),
+            path=get_results_metadata_path(batch_job_output_root, job_id=job_id),
             data={"foo": "bar", "usage": {"input_pixel": {"unit": "mega-pixel", "value": 1.125}}},
         )
         job_tracker.update_statuses()
@@ -1007,6 +1060,53 @@ class TestYarnStatusGetter:
 
         assert m_get.called
 
+    @responses.activate(registry=responses.registries.OrderedRegistry)
+    def test_get_job_metadata_retry_on_transient_error(self):
+        status_getter = YarnStatusGetter(ConfigParams().yarn_rest_api_base_url)
+        app_id = "app_123"
+        app_url = status_getter.get_application_url(app_id)
+        error_resp = responses.get(app_url, status=503)
+        ok_resp = responses.get(
+            app_url,
+            json=fake_yarn_rest_response_json(
+                app_id=app_id,
+                state="RUNNING",
+                final_status="UNDEFINED",
+                started_time=1673021672793,
+                finished_time=0,
+            ),
+        )
+
+        job_metadata = status_getter.get_job_metadata("j-abc123", "johndoe", app_id=app_id)
+        assert job_metadata.status == "running"
+        assert error_resp.call_count == 1
+        assert ok_resp.call_count == 1
+
+    @responses.activate
+    def test_get_job_metadata_persistent_error(self):
+        status_getter = YarnStatusGetter(ConfigParams().yarn_rest_api_base_url)
+        app_id = "app_123"
+        error_resp = responses.get(status_getter.get_application_url(app_id), status=503)
+
+        with mock.patch("urllib3.util.retry.Retry.sleep"):
+            # Retries exhausted: still the HTTPError of the last response (instead of a RetryError)
+            with pytest.raises(requests.HTTPError, match="503"):
+                status_getter.get_job_metadata("j-abc123", "johndoe", app_id=app_id)
+
+        assert error_resp.call_count == 4
+        assert all(call.request.req_kwargs["timeout"] == 20 for call in responses.calls)
+
+    @responses.activate
+    def test_get_job_metadata_no_retry_on_app_not_found(self):
+        status_getter = YarnStatusGetter(ConfigParams().yarn_rest_api_base_url)
+        app_id = "app_123"
+        not_found_resp = responses.get(status_getter.get_application_url(app_id), status=404)
+
+        with pytest.raises(AppNotFound):
+            status_getter.get_job_metadata("j-abc123", "johndoe", app_id=app_id)
+
+        assert not_found_resp.call_count == 1
+
 
 class TestK8sJobTracker:
     @pytest.fixture
@@ -1037,8 +1137,6 @@ class TestK8sJobTracker:
         job_tracker = JobTracker(
             app_state_getter=K8sStatusGetter(k8s_mock, prometheus_mock),
             zk_job_registry=zk_job_registry,
-            principal="john@EXAMPLE.TEST",
-            keytab="test/openeo.keytab",
             job_costs_calculator=job_costs_calculator,
             output_root_dir=batch_job_output_root,
             elastic_job_registry=elastic_job_registry,
@@ -1048,6 +1146,7 @@ class TestK8sJobTracker:
     @pytest.mark.parametrize("job_options", [None, DUMMY_JOB_OPTIONS])
     def test_k8s_zookeeper_basic(
         self,
+        batch_job_output_root,
         zk_job_registry,
         job_tracker,
         elastic_job_registry,
@@ -1148,7 +1247,7 @@ class TestK8sJobTracker:
         time_machine.coordinates.shift(70)
         kube_app.set_completed()
         json_write(
-            path=job_tracker._batch_jobs.get_results_metadata_path(job_id=job_id),
+            path=get_results_metadata_path(batch_job_output_root, job_id=job_id),
             data={
                 "foo": "bar",
                 "usage": {"input_pixel": {"unit": "mega-pixel", "value": 1.125},
@@ -1421,6 +1520,7 @@ class TestK8sJobTracker:
     @pytest.mark.parametrize("batch_job_base_fee_credits", [None, 1.23])
     def test_k8s_zookeeper_job_cost(
         self,
+        batch_job_output_root,
         zk_job_registry,
         job_tracker,
         elastic_job_registry,
@@ -1468,7 +1568,7 @@ class TestK8sJobTracker:
             kube_app.set_state(k8s_app_state)
             kube_app.set_finish_time()
             json_write(
-                path=job_tracker._batch_jobs.get_results_metadata_path(job_id=job_id),
+                path=get_results_metadata_path(batch_job_output_root, job_id=job_id),
                 data={
                     "usage": {
                         "input_pixel": {"unit": "mega-pixel", "value": 1.125},
@@ -1507,8 +1607,6 @@ class TestK8sJobTracker:
         job_tracker = JobTracker(
             app_state_getter=K8sStatusGetter(k8s_mock, prometheus_mock),
             zk_job_registry=None,
-            principal="john@EXAMPLE.TEST",
-            keytab="test/openeo.keytab",
             job_costs_calculator=job_costs_calculator,
             output_root_dir=batch_job_output_root,
             elastic_job_registry=elastic_job_registry,
@@ -1571,7 +1669,7 @@ class TestK8sJobTracker:
         time_machine.coordinates.shift(70)
         kube_app.set_completed()
         json_write(
-            path=job_tracker._batch_jobs.get_results_metadata_path(job_id=job_id),
+            path=get_results_metadata_path(batch_job_output_root, job_id=job_id),
             data={
                 "foo": "bar",
                 "usage": {"input_pixel": {"unit": "mega-pixel", "value": 1.125},
@@ -1647,6 +1745,25 @@ class TestK8sStatusGetter:
         assert job_metadata.usage.cpu_seconds == 1.5 * 3600
         assert job_metadata.usage.mb_seconds == 3 * 3600 * 1024
 
+    def test_no_usage_for_running_app(self):
+        prometheus_mock = mock.Mock(Prometheus)
+
+        k8s_mock = mock.Mock()
+        k8s_mock.get_namespaced_custom_object.return_value = {
+            "status": {
+                "applicationState": {"state": K8S_SPARK_APP_STATE.RUNNING},
+                "lastSubmissionAttemptTime": rfc3339.datetime(dt.datetime.utcnow()),
+                "terminationTime": None,
+            }
+        }
+
+        k8s_status_getter = K8sStatusGetter(k8s_mock, prometheus_mock)
+        job_metadata = k8s_status_getter.get_job_metadata(job_id="job-123", user_id="john", app_id=k8s_job_name())
+
+        assert job_metadata.status == "running"
+        assert job_metadata.usage.to_dict() == {}
+        assert prometheus_mock.mock_calls == []
+
 
 class TestCliApp:
     def test_run_basic_help(self, pytester):
@@ -4,15 +4,29 @@ from contextlib import nullcontext
 
 import mock
 import pytest
+import shapely.geometry
 from openeo_driver.ProcessGraphDeserializer import DEFAULT_TEMPORAL_EXTENT
 from openeo_driver.backend import BatchJobMetadata, BatchJobs, LoadParameters
+from openeo_driver.datacube import DriverVectorCube
 from openeo_driver.errors import OpenEOApiException
 from openeo_driver.utils import EvalEnv
 
-from openeogeotrellis.load_stac import extract_own_job_info, load_stac
+from openeogeotrellis.load_stac import (
+    _bboxes_intersect,
+    _format_utc,
+    _prefetched,
+    _search_intersects,
+    _search_page_size,
+    extract_own_job_info,
+    load_stac,
+)
 from tests.data import get_test_data_file
 
 
+# EvalEnv is immutable (`push` creates a new one), so this can be shared between tests.
+_PYRAMID_LEVELS_HIGHEST_ENV = EvalEnv({"pyramid_levels": "highest"})
+
+
 @pytest.mark.parametrize("url, user_id, job_info_id",
                          [
                              ("https://oeo.net/openeo/1.1/jobs/j-20240201abc123/results", 'alice', 'j-20240201abc123'),
@@ -22,15 +36,12 @@ from tests.data import get_test_data_file
                              ("https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a", 'alice', None)
                          ])
 def test_extract_own_job_info(url, user_id, job_info_id):
-    batch_jobs = mock.Mock(spec=BatchJobs)
+    class AlicesSingleJob:
+        def get_job_info(self, job_id, user_id):
+            return (BatchJobMetadata(id=job_id, status='finished', created=dt.datetime.utcnow())
+                    if job_id == 'j-20240201abc123' and user_id == 'alice' else None)
 
-    def alices_single_job(job_id, user_id):
-        return (BatchJobMetadata(id=job_id, status='finished', created=dt.datetime.utcnow())
-                if job_id == 'j-20240201abc123' and user_id == 'alice' else None)
-
-    batch_jobs.get_job_info.side_effect = alices_single_job
-
-    job_info = extract_own_job_info(url, user_id, batch_jobs=batch_jobs)
+    job_info = extract_own_job_info(url, user_id, batch_jobs=AlicesSingleJob())
 
     if job_info_id is None:
         assert job_info is None
@@ -38,15 +49,112 @@ def test_extract_own_job_info(url, user_id, job_info_id):
         assert job_info.id == job_info_id
 
 
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a",
+        "https://oeo.net/openeo/1.1/jobs",
+        "https://oeo.net/openeo/1.1/results",
+    ],
+)
+def test_extract_own_job_info_not_a_job_url(url):
+    batch_jobs = mock.Mock(spec=BatchJobs)
+
+    assert extract_own_job_info(url, "alice", batch_jobs=batch_jobs) is None
+    batch_jobs.get_job_info.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ["bbox", "other", "expected"],
+    [
+        ((0, 0, 1, 1), (0.5, 0.5, 2, 2), True),
+        ((0, 0, 1, 1), (0.2, 0.2, 0.8, 0.8), True),
+        ((0, 0, 1, 1), (1, 0, 2, 1), True),  # touching
+        ((0, 0, 1, 1), (2, 0, 3, 1), False),
+        ((0, 0, 1, 1), (0, 2, 1, 3), False),
+        ((0, 0, 1, 1), (-3, -3, -2, -2), False),
+    ],
+)
+def test_bboxes_intersect(bbox, other, expected):
+    assert _bboxes_intersect(bbox, other) is expected
+    assert _bboxes_intersect(other, bbox) is expected
+
+
+@pytest.mark.parametrize("iterable", [[], [1], [1, 2, 3], range(100)])
+def test_prefetched(iterable):
+    assert list(_prefetched(iterable)) == list(iterable)
+
+
+def test_prefetched_error():
+    def pages():
+        yield 1
+        raise ValueError("page 2 failed")
+
+    prefetched = _prefetched(pages())
+    assert next(prefetched) == 1
+    with pytest.raises(ValueError, match="page 2 failed"):
+        next(prefetched)
+
+
+@pytest.mark.parametrize(
+    ["date_time", "expected"],
+    [
+        (dt.datetime(2024, 6, 16), "2024-06-16T00:00:00Z"),
+        (dt.datetime(2024, 6, 16, tzinfo=dt.timezone.utc), "2024-06-16T00:00:00Z"),
+        (dt.datetime(2024, 6, 16, 2, tzinfo=dt.timezone(dt.timedelta(hours=2))), "2024-06-16T00:00:00Z"),
+        (
+            dt.datetime.combine(dt.date(2024, 6, 23), dt.time.max, dt.timezone.utc),
+            "2024-06-23T23:59:59.999999Z",
+        ),
+    ],
+)
+def test_format_utc(date_time, expected):
+    assert _format_utc(date_time) == expected
+
+
+@pytest.mark.parametrize(
+    ["requested", "expected"],
+    [
+        (None, 1000),
+        (50, 50),
+        ("200", 200),
+        (0, 1),
+        (1_000_000, 10000),
+    ],
+)
+def test_search_page_size(requested, expected):
+    assert _search_page_size(requested) == expected
+
+
+def test_search_intersects():
+    polygon = shapely.geometry.box(5.0, 51.0, 5.1, 51.1)
+    assert _search_intersects(polygon, crs="EPSG:4326") == shapely.geometry.mapping(polygon)
+    assert _search_intersects(None) is None
+    assert _search_intersects(shapely.geometry.Point(5.0, 51.0), crs="EPSG:4326") is None
+    too_large = shapely.geometry.Point(5.0, 51.0).buffer(0.1, quad_segs=1000)
+    assert _search_intersects(too_large, crs="EPSG:4326") is None
+
+    # bare geometry is in the CRS of the spatial extent: only use it if that is lon/lat
+    assert _search_intersects(polygon) is None
+    utm_polygon = shapely.geometry.box(640000.0, 5650000.0, 641000.0, 5651000.0)
+    assert _search_intersects(utm_polygon, crs="EPSG:32631") is None
+
+    vector_cube = DriverVectorCube.from_geometry(polygon)
+    assert _search_intersects(vector_cube) == shapely.geometry.mapping(vector_cube.to_multipolygon())
+    assert _search_intersects(vector_cube.reproject(32631)) is None
+
+
+# requests-mock lowercases query strings: https://github.com/jamielennox/requests-mock/issues/264
+_EXPECTED_PRODUCT_TILE_FILTER = """"properties.product_tile" = '31UFS'""".lower()
+
+
 def test_property_filter_from_parameter(requests_mock):
     stac_api_root_url = "https://stac.test"
     stac_collection_url = f"{stac_api_root_url}/collections/collection"
 
     def feature_collection(request, _) -> dict:
         assert request.qs["filter-lang"] == ["cql2-text"]
-        assert request.qs["filter"] == [
-            """"properties.product_tile" = '31UFS'""".lower()  # https://github.com/jamielennox/requests-mock/issues/264
-        ]
+        assert request.qs["filter"] == [_EXPECTED_PRODUCT_TILE_FILTER]
 
         return {
             "type": "FeatureCollection",
@@ -90,10 +198,9 @@ def test_dimensions(requests_mock):
     stac_api_root_url = "https://stac.test"
     stac_collection_url = f"{stac_api_root_url}/collections/collection"
 
-    stac_item = json.loads(
-        get_test_data_file("stac/issue609-api-temporal-bound-exclusive/item01.json")
-        .read_text()
-        .replace("asset01.tiff", f"file://{get_test_data_file('binary/load_stac/collection01/asset01.tif').absolute()}")
+    stac_item = json.loads(get_test_data_file("stac/issue609-api-temporal-bound-exclusive/item01.json").read_text())
+    stac_item["assets"]["asset1"]["href"] = (
+        f"file://{get_test_data_file('binary/load_stac/collection01/asset01.tif').absolute()}"
     )
 
     _mock_stac_api(
@@ -109,7 +216,7 @@ def test_dimensions(requests_mock):
     data_cube = load_stac(
         url=stac_collection_url,
         load_params=LoadParameters(),
-        env=EvalEnv({"pyramid_levels": "highest"}),
+        env=_PYRAMID_LEVELS_HIGHEST_ENV,
         layer_properties={},
         batch_jobs=None,
     )
@@ -212,7 +319,105 @@ def test_lcfm_improvements(  # resolution and offset behind a feature flag; alph
     )
 
 
-def _mock_stac_api(requests_mock, stac_api_root_url, stac_collection_url, feature_collection):
+@pytest.mark.parametrize(
+    ["conforms_to", "expected_feature_count"],
+    [
+        # Filter Extension with CQL2 JSON: rely on server-side filtering
+        (
+            [
+                "https://api.stacspec.org/v1.0.0-rc.3/item-search#filter",
+                "http://www.opengis.net/spec/cql2/1.0/conf/cql2-json",
+            ],
+            1,
+        ),
+        # Filter Extension, but only CQL2 text: filter client-side as well
+        (
+            [
+                "https://api.stacspec.org/v1.0.0-rc.3/item-search#filter",
+                "http://www.opengis.net/spec/cql2/1.0/conf/cql2-text",
+            ],
+            0,
+        ),
+        # Filter Extension without CQL2 conformance classes: filter client-side as well
+        (["https://api.stacspec.org/v1.0.0-rc.3/item-search#filter"], 0),
+    ],
+)
+def test_property_filter_server_side(requests_mock, jvm_mock, conforms_to, expected_feature_count):
+    expectation = (
+        nullcontext()
+        if expected_feature_count
+        else pytest.raises(OpenEOApiException, match="There is no data available for the given extents")
+    )
+    stac_api_root_url = "https://stac.test"
+    stac_collection_url = f"{stac_api_root_url}/collections/collection"
+
+    features = json.loads(get_test_data_file("stac/issue1043-api-proj-code/FeatureCollection.json").read_text())
+
+    _mock_stac_api(requests_mock, stac_api_root_url, stac_collection_url, feature_collection=features)
+    requests_mock.get(
+        stac_api_root_url,
+        json={
+            "type": "Catalog",
+            "stac_version": "1.0.0",
+            "id": "stac.test",
+            "description": "stac.test",
+            "links": [],
+            "conformsTo": ["https://api.stacspec.org/v1.0.0-rc.1/item-search"] + conforms_to,
+        },
+    )
+
+    def feature_collection(request, _) -> dict:
+        assert request.json()["filter"] == {"op": "=", "args": [{"property": "properties.product_tile"}, "36NYH"]}
+        return features
+
+    search_mock = requests_mock.post(f"{stac_api_root_url}/search", json=feature_collection)
+
+    properties = {
+        "product_tile": {
+            "process_graph": {
+                "eq1": {"process_id": "eq", "arguments": {"x": {"from_parameter": "value"}, "y": "36NYH"}, "result": True}
+            }
+        }
+    }
+
+    with expectation:
+        load_stac(
+            url=stac_collection_url,
+            load_params=LoadParameters(properties=properties, featureflags={"use-filter-extension": "cql2-json"}),
+            env=_PYRAMID_LEVELS_HIGHEST_ENV,
+            layer_properties={},
+            batch_jobs=None,
+        )
+
+    assert search_mock.called
+    # Item lacks "product_tile" property: it is only kept if not filtered out again client-side
+    opensearch_client = jvm_mock.org.openeo.geotrellis.file.FixedFeaturesOpenSearchClient.return_value
+    assert opensearch_client.addFeature.call_count == expected_feature_count
+
+
+def test_eo_bands_index_into_collection_summaries(requests_mock, jvm_mock):
+    stac_api_root_url = "https://stac.test"
+    stac_collection_url = f"{stac_api_root_url}/collections/collection"
+
+    def item(item_id: str) -> dict:
+        return {
+            "type": "Feature",
+            "stac_version": "1.0.0",
+            "id": item_id,
+            "collection": "collection",
+            "geometry": {"type": "Polygon", "coordinates": [[[4, 51], [5, 51], [5, 52], [4, 52], [4, 51]]]},
+            "bbox": [4, 51, 5, 52],
+            "properties": {"datetime": "2023-01-01T00:00:00Z"},
+            "links": [{"rel": "collection", "href": stac_collection_url}],
+            "assets": {"B01": {"href": "https://stac.test/B01.tif", "type": "image/tiff", "eo:bands": [0]}},
+        }
+
+    _mock_stac_api(
+        requests_mock,
+        stac_api_root_url,
+        stac_collection_url,
+        feature_collection={"type": "FeatureCollection", "features": [item("item01"), item("item02")]},
+    )
     requests_mock.get(
         stac_collection_url,
         json={
@@ -221,20 +426,114 @@ def _mock_stac_api(requests_mock, stac_api_root_url, stac_collection_url, featur
             "id": "collection",
             "description": "collection",
             "license": "unknown",
-            "extent": {
-                "spatial": {"bbox": [[-180, -90, 180, 90]]},
-                "temporal": {"interval": [[None, None]]},
-            },
-            "links": [
-                {
-                    "rel": "root",
-                    "href": stac_api_root_url,
-                }
-            ],
+            "extent": {"spatial": {"bbox": [[-180, -90, 180, 90]]}, "temporal": {"interval": [[None, None]]}},
+            "summaries": {"eo:bands": [{"name": "B01"}]},
+            "links": [{"rel": "root", "href": stac_api_root_url}],
+        },
+    )
+
+    data_cube = load_stac(
+        url=stac_collection_url,
+        load_params=LoadParameters(),
+        env=_PYRAMID_LEVELS_HIGHEST_ENV,
+        layer_properties={},
+        batch_jobs=None,
+    )
+
+    assert data_cube.metadata.band_names == ["B01"]
+
+
+def test_property_filter_client_side(requests_mock, jvm_mock):
+    stac_api_root_url = "https://stac.test"
+    stac_collection_url = f"{stac_api_root_url}/collections/collection"
+
+    def feature(item_id: str, product_tile: str) -> dict:
+        return {
+            "type": "Feature",
+            "stac_version": "1.0.0",
+            "id": item_id,
+            "geometry": {"type": "Polygon", "coordinates": [[[4, 51], [5, 51], [5, 52], [4, 52], [4, 51]]]},
+            "bbox": [4, 51, 5, 52],
+            "properties": {"datetime": "2023-01-01T00:00:00Z", "product_tile": product_tile},
+            "links": [],
+            "assets": {"B01": {"href": f"https://stac.test/{item_id}/B01.tif", "type": "image/tiff"}},
+        }
+
+    search_mock = _mock_stac_api(
+        requests_mock,
+        stac_api_root_url,
+        stac_collection_url,
+        feature_collection={
+            "type": "FeatureCollection",
+            "features": [feature("item01", "36NYH"), feature("item02", "31UFS")],
+        },
+    )
+
+    properties = {
+        "product_tile": {
+            "process_graph": {
+                "eq1": {"process_id": "eq", "arguments": {"x": {"from_parameter": "value"}, "y": "36NYH"}, "result": True}
+            }
+        }
+    }
+
+    load_stac(
+        url=stac_collection_url,
+        load_params=LoadParameters(properties=properties, featureflags={"use-filter-extension": False}),
+        env=_PYRAMID_LEVELS_HIGHEST_ENV,
+        layer_properties={},
+        batch_jobs=None,
+    )
+
+    assert search_mock.called
+    opensearch_client = jvm_mock.org.openeo.geotrellis.file.FixedFeaturesOpenSearchClient.return_value
+    assert opensearch_client.addFeature.call_count == 1
+    builder = jvm_mock.org.openeo.opensearch.OpenSearchResponses.featureBuilder.return_value
+    builder.withId.assert_called_once_with("item01")
+
+
+@pytest.mark.parametrize(
+    ["conforms_to_fields", "expected_fields"],
+    [
+        (True, ["-properties.description"]),
+        (False, None),
+    ],
+)
+def test_fields_from_feature_flag(requests_mock, jvm_mock, conforms_to_fields, expected_fields):
+    stac_api_root_url = "https://stac.test"
+    stac_collection_url = f"{stac_api_root_url}/collections/collection"
+
+    features = json.loads(get_test_data_file("stac/issue1043-api-proj-code/FeatureCollection.json").read_text())
+    search_mock = _mock_stac_api(requests_mock, stac_api_root_url, stac_collection_url, feature_collection=features)
+    conforms_to = ["https://api.stacspec.org/v1.0.0-rc.1/item-search"]
+    if conforms_to_fields:
+        conforms_to.append("https://api.stacspec.org/v1.0.0-rc.1/item-search#fields")
+    requests_mock.get(
+        stac_api_root_url,
+        json={
+            "type": "Catalog",
+            "stac_version": "1.0.0",
+            "id": "stac.test",
+            "description": "stac.test",
+            "links": [],
+            "conformsTo": conforms_to,
         },
     )
 
-    catalog_response = {
+    load_stac(
+        url=stac_collection_url,
+        load_params=LoadParameters(featureflags={"load_stac_fields": ["-properties.description"]}),
+        env=_PYRAMID_LEVELS_HIGHEST_ENV,
+        layer_properties={},
+        batch_jobs=None,
+    )
+
+    assert search_mock.last_request.qs.get("fields") == expected_fields
+
+
+# Identical for every mocked STAC API: serialize once instead of on every request.
+_STAC_API_CATALOG_JSON = json.dumps(
+    {
         "type": "Catalog",
         "stac_version": "1.0.0",
         "id": "stac.test",
@@ -245,8 +544,34 @@ def _mock_stac_api(requests_mock, stac_api_root_url, stac_collection_url, featur
             "https://api.stacspec.org/v1.0.0-rc.3/item-search#filter",
         ],
     }
+)
 
-    requests_mock.get(stac_api_root_url, json=catalog_response)
+
+def _mock_stac_api(requests_mock, stac_api_root_url, stac_collection_url, feature_collection):
+    requests_mock.get(
+        stac_collection_url,
+        json={
+            "type": "Collection",
+            "stac_version": "1.0.0",
+            "id": "collection",
+            "description": "collection",
+            "license": "unknown",
+            "extent": {
+                "spatial": {"bbox": [[-180, -90, 180, 90]]},
+                "temporal": {"interval": [[None, None]]},
+            },
+            "links": [
+                {
+                    "rel": "root",
+                    "href": stac_api_root_url,
+                }
+            ],
+        },
+    )
+
+    requests_mock.get(
+        stac_api_root_url, text=_STAC_API_CATALOG_JSON, headers={"Content-Type": "application/json"}
+    )
 
     search_mock = requests_mock.get(f"{stac_api_root_url}/search", json=feature_collection)
     return search_mock
@@ -263,7 +588,7 @@ def test_world_oom(requests_mock):
     load_stac(
         url=stac_item_url,
         load_params=LoadParameters(),
-        env=EvalEnv({"pyramid_levels": "highest"}),
+        env=_PYRAMID_LEVELS_HIGHEST_ENV,
         layer_properties={},
         batch_jobs=None,
     )
@@ -274,10 +599,10 @@ def test_world_oom(requests_mock):
     [
         (
             {},
-            EvalEnv({"pyramid_levels": "highest"}),
+            _PYRAMID_LEVELS_HIGHEST_ENV,
             pytest.raises(OpenEOApiException, match="There is no data available for the given extents"),
         ),
-        ({"allow_empty_cube": True}, EvalEnv({"pyramid_levels": "highest"}), nullcontext()),
+        ({"allow_empty_cube": True}, _PYRAMID_LEVELS_HIGHEST_ENV, nullcontext()),
         ({}, EvalEnv({"pyramid_levels": "highest", "allow_empty_cubes": True}), nullcontext()),
         ({}, EvalEnv({"allow_empty_cubes": True}), nullcontext()),  # pyramid_seq
     ],
@@ -320,10 +645,10 @@ def test_empty_cube_from_stac_api(requests_mock, featureflags, env, expectation)
     [
         (
             {},
-            EvalEnv({"pyramid_levels": "highest"}),
+            _PYRAMID_LEVELS_HIGHEST_ENV,
             pytest.raises(OpenEOApiException, match="There is no data available for the given extents"),
         ),
-        ({"allow_empty_cube": True}, EvalEnv({"pyramid_levels": "highest"}), nullcontext()),
+        ({"allow_empty_cube": True}, _PYRAMID_LEVELS_HIGHEST_ENV, nullcontext()),
         ({}, EvalEnv({"pyramid_levels": "highest", "allow_empty_cubes": True}), nullcontext()),
         ({}, EvalEnv({"allow_empty_cubes": True}), nullcontext()),  # pyramid_seq
     ],
@@ -349,3 +674,45 @@ def test_empty_cube_from_non_intersecting_item(requests_mock, featureflags, env,
         assert data_cube.metadata.band_names == ["A1"]
         for level in data_cube.pyramid.levels.values():
             assert level.count() == 0
+
+
+def test_static_catalog_skips_non_intersecting_child_link(requests_mock):
+    catalog_url = "https://stac.test/catalog.json"
+    requests_mock.get(
+        catalog_url,
+        json={
+            "type": "Catalog",
+            "stac_version": "1.0.0",
+            "id": "catalog",
+            "description": "catalog",
+            "links": [
+                {"rel": "self", "href": catalog_url},
+                {"rel": "root", "href": catalog_url},
+                # Child link with extent hints: should be skipped without fetching it (it is not mocked).
+                {
+                    "rel": "child",
+                    "href": "https://stac.test/far/collection.json",
+                    "bbox": [100.0, 10.0, 101.0, 11.0],
+                },
+                {
+                    "rel": "child",
+                    "href": "https://stac.test/old/collection.json",
+                    "temporal": ["2000-01-01T00:00:00Z", "2000-12-31T23:59:59Z"],
+                },
+            ],
+        },
+    )
+
+    with pytest.raises(OpenEOApiException, match="There is no data available for the given extents"):
+        load_stac(
+            url=catalog_url,
+            load_params=LoadParameters(
+                spatial_extent={"west": 0.0, "south": 50.0, "east": 1.0, "north": 51.0},
+                temporal_extent=["2023-01-01", "2023-02-01"],
+            ),
+            env=_PYRAMID_LEVELS_HIGHEST_ENV,
+            layer_properties={},
+            batch_jobs=None,
+        )
+
+    assert [r.url for r in requests_mock.request_history] == [catalog_url]
@@ -124,6 +124,55 @@ def test_merge_into_existing(requests_mock, tmp_path):
     )
 
 
+def test_merge_multiple_items(requests_mock, tmp_path):
+    stac_api_workspace = StacApiWorkspace(
+        root_url="https://stacapi.test",
+        export_asset=_export_asset,
+        asset_alternate_id="file",
+    )
+    target = PurePath("new_collection")
+
+    _mock_stac_api_root_catalog(requests_mock, stac_api_workspace.root_url)
+    requests_mock.get(f"{stac_api_workspace.root_url}/collections/{target}", status_code=404)
+    requests_mock.post(f"{stac_api_workspace.root_url}/collections")
+    create_item_mock = requests_mock.post(f"{stac_api_workspace.root_url}/collections/{target}/items")
+
+    collection = _collection_with_items(tmp_path / "collection", item_count=20)
+    imported_collection = stac_api_workspace.merge(stac_resource=collection, target=target)
+
+    assert _asset_workspace_uris(imported_collection, alternate_key="file") == {
+        f"asset{i}.tif": f"/path/to/asset{i}.tif" for i in range(20)
+    }
+    assert create_item_mock.call_count == 20
+    assert {request.json()["id"] for request in create_item_mock.request_history} == {
+        f"asset{i}.tif" for i in range(20)
+    }
+
+
+def test_merge_checks_conformance_once(requests_mock, tmp_path):
+    stac_api_workspace = StacApiWorkspace(
+        root_url="https://stacapi.test",
+        export_asset=_export_asset,
+        asset_alternate_id="file",
+    )
+    target = PurePath("new_collection")
+
+    get_root_catalog_mock = _mock_stac_api_root_catalog(requests_mock, stac_api_workspace.root_url)
+    requests_mock.get(f"{stac_api_workspace.root_url}/collections/{target}", status_code=404)
+    requests_mock.post(f"{stac_api_workspace.root_url}/collections")
+    requests_mock.post(f"{stac_api_workspace.root_url}/collections/{target}/items")
+
+    for i in range(2):
+        collection = _collection(
+            root_path=tmp_path / f"collection{i}",
+            collection_id=f"collection{i}",
+            asset_path=Path(f"/path/asset{i}.tif"),
+        )
+        stac_api_workspace.merge(stac_resource=collection, target=target)
+
+    assert get_root_catalog_mock.call_count == 1
+
+
 @responses.activate(registry=responses.registries.OrderedRegistry)
 def test_merge_resilience(tmp_path):
     stac_api_workspace = StacApiWorkspace(
@@ -200,7 +249,7 @@ def test_validate_collection_id(requests_mock, tmp_path):
 
 def _mock_stac_api_root_catalog(requests_mock, root_url: str):
     # STAC API root catalog with "conformsTo" for pystac_client
-    requests_mock.get(
+    return requests_mock.get(
         root_url,
         json={
             "type": "Catalog",
@@ -230,6 +279,17 @@ def _asset_workspace_uris(collection: Collection, alternate_key: str) -> Dict[st
     }
 
 
+def _collection_with_items(root_path: Path, item_count: int) -> Collection:
+    collection = _collection(root_path=root_path, collection_id="collection", asset_path=Path("/path/to/asset0.tif"))
+    for i in range(1, item_count):
+        item = Item(
+            id=f"asset{i}.tif", geometry=None, bbox=None, datetime=dt.datetime.now(dt.timezone.utc), properties={}
+        )
+        item.add_asset(f"asset{i}.tif", Asset(href=f"/path/to/asset{i}.tif"))
+        collection.add_item(item)
+    return collection
+
+
 def _collection(
     root_path: Path,
     collection_id: str,
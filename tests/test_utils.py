@@ -5,6 +5,7 @@ import json
 import logging
 import pathlib
 from pathlib import Path
+from unittest import mock
 
 import pytest
 from openeo_driver.testing import TIFF_DUMMY_DATA
@@ -19,6 +20,7 @@ from openeogeotrellis.utils import (
     dict_merge_recursive,
     json_default,
     lonlat_to_mercator_tile_indices,
+    lonlat_to_mercator_tile_indices_batch,
     map_optional,
     nullcontext,
     parse_approximate_isoduration,
@@ -118,8 +120,13 @@ def test_describe_path(tmp_path):
 
     assert describe_path(tmp_path / "invalid")["status"] == "does not exist"
 
+    dangling = tmp_path / "dangling.txt"
+    dangling.symlink_to(tmp_path / "invalid")
+    assert describe_path(dangling)["status"] == "does not exist"
 
-@pytest.mark.parametrize(["lon", "lat", "zoom", "flip_y", "expected"], [
+
+# (lon, lat, zoom, flip_y, expected)
+LONLAT_TO_MERCATOR_TILE_INDICES_CASES = [
     (0, 0, 0, False, (0, 0)),
     (0, 0, 1, False, (0, 0)),
     (0, 0, 2, False, (1, 1)),
@@ -149,11 +156,25 @@ def test_describe_path(tmp_path):
     (3.2, 51.3, 6, True, (32, 21)),
     (3.2, 51.3, 8, True, (130, 85)),
     (3.2, 51.3, 10, True, (521, 341)),
-])
+]
+
+
+@pytest.mark.parametrize(["lon", "lat", "zoom", "flip_y", "expected"], LONLAT_TO_MERCATOR_TILE_INDICES_CASES)
 def test_lonlat_to_mercator_tile_indices(lon, lat, zoom, flip_y, expected):
     assert lonlat_to_mercator_tile_indices(longitude=lon, latitude=lat, zoom=zoom, flip_y=flip_y) == expected
 
 
+def test_lonlat_to_mercator_tile_indices_batch():
+    # Batch per (zoom, flip_y) combination of the scalar test cases.
+    groups = collections.defaultdict(list)
+    for lon, lat, zoom, flip_y, expected in LONLAT_TO_MERCATOR_TILE_INDICES_CASES:
+        groups[zoom, flip_y].append((lon, lat, expected))
+    for (zoom, flip_y), cases in groups.items():
+        lons, lats, expected = zip(*cases)
+        txs, tys = lonlat_to_mercator_tile_indices_batch(lons, lats, zoom=zoom, flip_y=flip_y)
+        assert list(zip(txs, tys)) == list(expected)
+
+
 def test_nullcontext():
     with nullcontext() as n:
         assert n is None
@@ -250,6 +271,15 @@ class TestStatsReporter:
 
         assert caplog.messages == ['stats: {"apple": 1, "banana": 12}']
 
+    def test_logger_disabled(self, caplog):
+        caplog.set_level(logging.WARNING)
+        with mock.patch("openeogeotrellis.utils.json.dumps") as dumps:
+            with StatsReporter() as stats:
+                stats["apple"] += 1
+
+        dumps.assert_not_called()
+        assert caplog.messages == []
+
 
 def test_get_s3_binary_file_contents(mock_s3_bucket):
     """Upload a file to the mock implementation of S3 and check that our wrapper